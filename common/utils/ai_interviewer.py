@@ -6,15 +6,15 @@ questions tuned to governance frameworks before producing final analysis.
 
 from __future__ import annotations
 
+import collections
+import functools
 import os
-from typing import Optional
+import threading
+from typing import Callable, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
+from .ai_parser import SYSTEM_PROMPT as ANALYSIS_SYSTEM_PROMPT, ScenarioAnalysis
 
 
 class InterviewQuestion(BaseModel):
@@ -29,6 +29,10 @@ class InterviewQuestion(BaseModel):
     framework_reference: str = Field(
         description="Which governance framework or requirement this relates to"
     )
+    answer_index: Optional[int] = Field(
+        default=None,
+        description="[index] of the previous answer this follow-up refers to, if any"
+    )
 
 
 class InterviewResponse(BaseModel):
@@ -51,6 +55,18 @@ class InterviewResponse(BaseModel):
     )
 
 
+class InterviewTurnResult(BaseModel):
+    """Follow-up interview decision plus, once ready, the final analysis."""
+    
+    interview: InterviewResponse = Field(
+        description="Whether the answers are sufficient, and any remaining questions"
+    )
+    analysis: Optional[ScenarioAnalysis] = Field(
+        default=None,
+        description="Full scenario analysis; required when interview.ready_for_analysis is true"
+    )
+
+
 INTERVIEW_SYSTEM_PROMPT = """You are an expert AI governance consultant conducting an initial assessment interview.
 
 Your role is to ask targeted clarifying questions to ensure comprehensive risk assessment aligned with:
@@ -141,6 +157,81 @@ Analyze the user's scenario description and determine what clarifying questions
 """
 
 
+# Follow-up rounds decide readiness and analyse in one request, so the analyst
+# instructions lead and the interview rules follow as a short addendum.
+FOLLOW_UP_SYSTEM_PROMPT = ANALYSIS_SYSTEM_PROMPT + """
+
+**INTERVIEW FOLLOW-UP:**
+The input is an initial description plus the user's answers to your clarifying questions, each tagged with its [index].
+- Fill `interview` first. Unless a critical, tier-changing detail is still missing, set ready_for_analysis=True, needs_clarification=False and ask no questions.
+- When ready_for_analysis is True, fill `analysis` from the description AND the answers, and list anything still unknown in gaps_and_limitations.
+- When more questions are needed (3 at most), set answer_index on each one and leave `analysis` null."""
+
+
+def format_indexed_history(conversation_history: list[dict]) -> str:
+    """Format Q&A turns as ``[index]``-tagged items for a single batched prompt.
+
+    Args:
+        conversation_history: List of {"question": str, "answer": str} turns
+
+    Returns:
+        One block per turn: ``[1] Q: <question>`` followed by ``A: <answer>``
+    """
+    return "".join(
+        f"[{i}] Q: {turn['question']}\nA: {turn['answer']}\n\n"
+        for i, turn in enumerate(conversation_history, 1)
+    )
+
+
+def _request_interview(user_prompt: str, *, api_key: Optional[str], demo_mode: bool = False) -> dict:
+    """Send a single interview prompt through the shared OpenAI helper."""
+    from .openai_helpers import safe_openai_call
+    
+    return safe_openai_call(
+        messages=[
+            {"role": "system", "content": INTERVIEW_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        model="gpt-4o",
+        temperature=0.5,
+        response_format=InterviewResponse,
+        demo_mode=demo_mode,
+        api_key=api_key,
+    )
+
+
+def _interview_user_prompt(initial_description: str, conversation_history: Optional[list[dict]]) -> str:
+    """Build the interviewer's user message for the first or a follow-up round."""
+    # Build conversation context
+    conversation_context = f"**Initial Description:**\n{initial_description}\n\n"
+    
+    if conversation_history:
+        conversation_context += "**Previous Q&A:**\n"
+        conversation_context += format_indexed_history(conversation_history)
+    
+    # DEMO MODE: After first round, always proceed to analysis
+    if conversation_history:
+        # User has already answered questions - proceed to analysis
+        user_prompt = f"""{conversation_context}
+
+The user has answered your questions. You now have sufficient context for a demonstration assessment.
+
+All answers are listed above in one batch, each tagged with its [index]. Review them together in this single pass. If you include any question, set its answer_index to the [index] it follows up on and keep questions in the same order as the answers.
+
+Set ready_for_analysis=True and proceed. (It's okay if some details are unknown - the final analysis will note gaps and limitations.)"""
+    else:
+        # First round - ask 3-4 quick questions
+        user_prompt = f"""{conversation_context}
+
+This is a DEMO tool. Ask 3-4 quick, high-impact questions that would most affect the risk tier.
+
+Don't try to be exhaustive - just get enough for a useful demonstration assessment. The final analysis can note gaps if needed.
+
+If the description is already comprehensive, ask 1-2 clarifying questions and prepare to proceed to analysis."""
+    
+    return user_prompt
+
+
 def conduct_interview(
     initial_description: str,
     conversation_history: list[dict] = None,
@@ -158,59 +249,208 @@ def conduct_interview(
     Returns:
         InterviewResponse with questions or ready_for_analysis=True
     """
-    from .openai_helpers import safe_openai_call
-    
     if not initial_description or not initial_description.strip():
         return None
     
     api_key = api_key or os.getenv("OPENAI_API_KEY")
     
-    # Build conversation context
-    conversation_context = f"**Initial Description:**\n{initial_description}\n\n"
+    user_prompt = _interview_user_prompt(initial_description, conversation_history)
     
-    if conversation_history:
-        conversation_context += "**Previous Q&A:**\n"
-        for i, turn in enumerate(conversation_history, 1):
-            conversation_context += f"Q{i}: {turn['question']}\n"
-            conversation_context += f"A{i}: {turn['answer']}\n\n"
+    result = _request_interview(user_prompt, api_key=api_key, demo_mode=demo_mode)
     
-    # DEMO MODE: After first round, always proceed to analysis
-    if conversation_history:
-        # User has already answered questions - proceed to analysis
-        user_prompt = f"""{conversation_context}
+    if result["success"]:
+        return result["data"]
+    else:
+        # Raise error so UI can display it
+        raise Exception(f"Interview failed: {result.get('error', 'Unknown error')}")
 
-The user has answered your questions. You now have sufficient context for a demonstration assessment.
 
-Set ready_for_analysis=True and proceed. (It's okay if some details are unknown - the final analysis will note gaps and limitations.)"""
-    else:
-        # First round - ask 3-4 quick questions
-        user_prompt = f"""{conversation_context}
+def stream_interview(
+    initial_description: str,
+    on_question: Callable[[InterviewQuestion], None],
+    api_key: Optional[str] = None,
+    demo_mode: bool = False,
+) -> Optional[InterviewResponse]:
+    """Run the first interview round, handing each question over as it completes.
+    
+    The structured response is streamed, so ``on_question`` can render the first
+    question while the model is still writing the rest. Completed rounds are
+    cached on the stripped description, so re-analyzing it costs no API call;
+    callers must treat the returned response as read-only.
+    
+    Args:
+        initial_description: User's initial use case description
+        on_question: Called once per question, in order
+        api_key: OpenAI API key
+        demo_mode: If True, replay the canned response without API call
+        
+    Returns:
+        The complete InterviewResponse, as ``conduct_interview`` would return it
+    """
+    if not initial_description or not initial_description.strip():
+        return None
+    
+    # Analyzing the same description again replays the earlier questions
+    key = (initial_description.strip(), api_key or os.getenv("OPENAI_API_KEY"), demo_mode)
+    with _FIRST_ROUND_LOCK:
+        response = _FIRST_ROUND_CACHE.get(key)
+        if response is not None:
+            _FIRST_ROUND_CACHE.move_to_end(key)
+    if response is not None:
+        for question in response.questions:
+            on_question(question)
+        return response
+    
+    response = _stream_first_round(*key, on_question)
+    with _FIRST_ROUND_LOCK:
+        _FIRST_ROUND_CACHE[key] = response
+        while len(_FIRST_ROUND_CACHE) > _FIRST_ROUND_CACHE_SIZE:
+            _FIRST_ROUND_CACHE.popitem(last=False)
+    return response
 
-This is a DEMO tool. Ask 3-4 quick, high-impact questions that would most affect the risk tier.
 
-Don't try to be exhaustive - just get enough for a useful demonstration assessment. The final analysis can note gaps if needed.
+# Completed first rounds, most recently used last; shared by every session thread.
+_FIRST_ROUND_CACHE_SIZE = 32
+_FIRST_ROUND_CACHE: "collections.OrderedDict[tuple, InterviewResponse]" = collections.OrderedDict()
+_FIRST_ROUND_LOCK = threading.Lock()
 
-If the description is already comprehensive, ask 1-2 clarifying questions and prepare to proceed to analysis."""
+
+def _stream_first_round(
+    initial_description: str,
+    api_key: Optional[str],
+    demo_mode: bool,
+    on_question: Callable[[InterviewQuestion], None],
+) -> InterviewResponse:
+    from .openai_helpers import get_openai_client
+    
+    if demo_mode:
+        response = conduct_interview(initial_description, None, api_key, demo_mode=True)
+        for question in response.questions:
+            on_question(question)
+        return response
+    
+    client = get_openai_client(api_key)
+    if client is None:
+        raise Exception("Interview failed: OpenAI package not installed")
+    
+    emitted = 0
+    try:
+        with client.beta.chat.completions.stream(
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": INTERVIEW_SYSTEM_PROMPT},
+                {"role": "user", "content": _interview_user_prompt(initial_description, None)}
+            ],
+            temperature=0.5,
+            response_format=InterviewResponse,
+        ) as stream:
+            for event in stream:
+                if event.type != "content.delta" or not isinstance(event.parsed, dict):
+                    continue
+                # Every question but the last one in the partial object is complete
+                questions = event.parsed.get("questions") or []
+                while emitted < len(questions) - 1:
+                    on_question(InterviewQuestion.model_validate(questions[emitted]))
+                    emitted += 1
+            response = stream.get_final_completion().choices[0].message.parsed
+    except Exception as e:
+        raise Exception(f"Interview failed: {e}") from e
+    
+    if response is None:
+        raise Exception("Interview failed: empty response")
+    for question in response.questions[emitted:]:
+        on_question(question)
+    return response
+
+
+def conduct_follow_up_interview(
+    initial_description: str,
+    conversation_history: list[dict],
+    api_key: Optional[str] = None,
+    demo_mode: bool = False,
+) -> Tuple[Optional[InterviewResponse], Optional[ScenarioAnalysis]]:
+    """Review submitted answers and, when ready, analyse the scenario in the same request.
     
-    messages = [
-        {"role": "system", "content": INTERVIEW_SYSTEM_PROMPT},
-        {"role": "user", "content": user_prompt}
-    ]
+    Replaces a separate interview call followed by ``parse_scenario_with_ai`` once
+    answers exist, saving a round-trip and a second copy of the system prompt.
     
+    Args:
+        initial_description: User's initial use case description
+        conversation_history: List of {"question": str, "answer": str} already answered
+        api_key: OpenAI API key
+        demo_mode: If True, return canned response without API call
+        
+    Returns:
+        ``(interview_response, analysis)``; analysis is None unless ready_for_analysis
+    """
+    from .openai_helpers import safe_openai_call
+    
+    if not initial_description or not initial_description.strip():
+        return None, None
+    
+    user_prompt = (
+        f"**Initial Description:**\n{initial_description}\n\n"
+        f"**Previous Q&A:**\n{format_indexed_history(conversation_history)}"
+        "Decide whether these answers are sufficient and, if so, produce the full analysis."
+    )
     result = safe_openai_call(
-        messages=messages,
+        messages=[
+            {"role": "system", "content": FOLLOW_UP_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
         model="gpt-4o",
-        temperature=0.5,
-        response_format=InterviewResponse,
+        temperature=0.3,
+        response_format=InterviewTurnResult,
         demo_mode=demo_mode,
-        api_key=api_key,
+        api_key=api_key or os.getenv("OPENAI_API_KEY"),
     )
     
-    if result["success"]:
-        return result["data"]
-    else:
-        # Raise error so UI can display it
+    if not result["success"]:
         raise Exception(f"Interview failed: {result.get('error', 'Unknown error')}")
+    
+    turn = result["data"]
+    if not turn.interview.ready_for_analysis:
+        return turn.interview, None
+    return turn.interview, turn.analysis
+
+
+@functools.lru_cache(maxsize=8)
+def _conduct_follow_up_memo(
+    initial_description: str,
+    history_key: Tuple[Tuple[str, str], ...],
+    api_key: Optional[str],
+    demo_mode: bool,
+) -> Tuple[Optional[InterviewResponse], Optional[ScenarioAnalysis]]:
+    history = [{"question": q, "answer": a} for q, a in history_key]
+    return conduct_follow_up_interview(initial_description, history, api_key, demo_mode)
+
+
+def conduct_follow_up_interview_cached(
+    initial_description: str,
+    conversation_history: list[dict],
+    api_key: Optional[str] = None,
+    demo_mode: bool = False,
+) -> Tuple[Optional[InterviewResponse], Optional[ScenarioAnalysis]]:
+    """Like ``conduct_follow_up_interview``, but resubmitted answers reuse the result.
+
+    Answers are whitespace-normalized before keying, so resubmitting answers
+    that only differ in surrounding whitespace skips the analysis call. Failures raise and
+    are not cached; callers must treat the returned objects as read-only.
+    """
+    return _conduct_follow_up_memo(
+        initial_description.strip() if initial_description else initial_description,
+        _history_key(conversation_history),
+        api_key or os.getenv("OPENAI_API_KEY"),
+        demo_mode,
+    )
+
+
+def _history_key(conversation_history: Optional[list[dict]]) -> Tuple[Tuple[str, str], ...]:
+    """Hashable, whitespace-normalized form of the answered questions."""
+    return tuple(
+        (turn["question"], turn["answer"].strip())
+        for turn in conversation_history or ()
+    )
 
 
 def format_interview_questions(response: InterviewResponse) -> str:
@@ -6,16 +6,12 @@ and suggest risk modifier values, demonstrating governance-as-code meets LLM cap
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
-
 
 class ScenarioAnalysis(BaseModel):
     """Structured output from AI scenario parsing."""
@@ -319,6 +315,49 @@ def parse_scenario_with_ai(
         return None
 
 
+class _ParseFailed(Exception):
+    """Raised inside the memo so failed parses are never cached."""
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_scenario_memo(
+    use_case_description: str,
+    api_key: Optional[str],
+    model: str,
+    demo_mode: bool,
+) -> ScenarioAnalysis:
+    analysis = parse_scenario_with_ai(use_case_description, api_key, model, demo_mode)
+    if analysis is None:
+        raise _ParseFailed
+    return analysis
+
+
+def parse_scenario_with_ai_cached(
+    use_case_description: str,
+    api_key: Optional[str] = None,
+    model: str = "gpt-4o",
+    demo_mode: bool = False,
+) -> Optional[ScenarioAnalysis]:
+    """Like ``parse_scenario_with_ai``, but identical descriptions reuse the previous analysis.
+
+    Resubmitting the same text (a double-click, or an unchanged re-analysis) costs
+    no API call. Failed parses are not cached; callers must treat the returned
+    analysis as read-only.
+    """
+    if not use_case_description or not use_case_description.strip():
+        return None
+
+    try:
+        return _parse_scenario_memo(
+            use_case_description.strip(),
+            api_key or os.getenv("OPENAI_API_KEY"),
+            model,
+            demo_mode,
+        )
+    except _ParseFailed:
+        return None
+
+
 def format_analysis_summary(analysis: ScenarioAnalysis) -> str:
     """Format the AI analysis into a human-readable summary.
 
@@ -0,0 +1,261 @@
+"""Prompt assembly for the interactive governance Q&A advisor.
+
+Helpers live here rather than in the Streamlit script because Streamlit
+re-executes the script module on every rerun, which would discard any
+``functools.lru_cache`` state defined there.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple
+
+# Static role/guidelines text leads the system prompt so it is byte-identical
+# across turns; OpenAI's automatic prefix caching can then reuse it.
+GOVERNANCE_SYSTEM_PREAMBLE = """You are an expert AI governance advisor helping teams understand their risk assessment results and implement safeguards.
+
+**YOUR ROLE:**
+You are a helpful governance advisor who:
+- Explains WHY specific safeguards are required (citing regulations)
+- Clarifies technical governance concepts in plain language
+- Provides actionable implementation guidance
+- Helps draft communications to legal/compliance/security teams
+- References the SPECIFIC assessment details below in your answers
+
+**GUIDELINES:**
+1. **Be specific:** Always reference the actual scenario, risk tier, and safeguards from THIS assessment
+2. **Be practical:** Provide concrete next steps, not just theory
+3. **Cite sources:** Mention specific regulations (GDPR Art. 22, HIPAA 164.308, EU AI Act Art. 52, etc.)
+4. **Be concise:** 2-3 paragraphs max unless asked for detailed explanation
+5. **Caveat appropriately:** Remind users to validate with legal/compliance when making decisions
+
+**EXAMPLE RESPONSE STYLES:**
+
+For "Why" questions:
+- Explain the specific risk factors that led to the tier/safeguard
+- Connect to regulatory requirements
+- Use this assessment's details
+
+For "How" questions:
+- Provide step-by-step implementation guidance
+- Suggest tools/frameworks when relevant
+- Include success criteria
+
+For "Draft" requests:
+- Use professional but clear language
+- Include specific details from this scenario
+- Provide structure (subject line, sections, next steps)
+
+For framework questions:
+- Explain the regulation in plain language
+- Show how it applies to THIS scenario
+- Provide compliance checklist
+
+---
+
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def build_governance_context(
+    use_case: str,
+    tier: str,
+    score: int,
+    contributing_factors: Tuple[str, ...],
+    top_controls: Tuple[Tuple[str, str, str, str], ...],
+    frameworks_text: str,
+    reasoning: str,
+) -> str:
+    """Render the assessment-specific block appended to the static preamble."""
+
+    risk_factors_text = ", ".join(contributing_factors) if contributing_factors else "None"
+
+    if top_controls:
+        controls_text = "".join(
+            f"{i}. **{title}** ({authority} {clause}): {description}\n"
+            for i, (title, authority, clause, description) in enumerate(top_controls, 1)
+        )
+    else:
+        controls_text = "No specific safeguards triggered for this risk profile."
+
+    return f"""**CURRENT ASSESSMENT CONTEXT:**
+
+**Scenario:** {use_case}
+
+**Risk Classification:**
+- Tier: {tier}
+- Score: {score} points
+- Key Risk Factors: {risk_factors_text}
+
+**Applicable Governance Frameworks:** {frameworks_text}
+
+**Top Safeguards Required:**
+{controls_text}
+
+**AI Analysis Reasoning:** {reasoning}
+
+---
+
+**IMPORTANT:** Always answer in the context of the current assessment shown above. Don't give generic governance advice - make it specific to this {tier} tier scenario with score {score}."""
+
+
+def format_numbered_questions(questions: Sequence[str]) -> str:
+    """Render several questions as one numbered list for a single request."""
+
+    return "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+
+
+# Output tokens dominate answer latency, so each question gets a completion cap
+# sized to what it asks for. Budgets include room for the citations/caveats JSON.
+_DRAFT_QUESTION = re.compile(r"\b(draft|write|email|memo|letter|template)\b", re.I)
+_HOW_QUESTION = re.compile(r"\b(how|why|implement|steps|explain|plan|compare)\b", re.I)
+ANSWER_TOKEN_BUDGETS: Dict[str, int] = {"draft": 800, "explain": 400, "fact": 250}
+# A batch gets every question's budget, up to five drafting answers' worth.
+MAX_BATCHED_ANSWER_TOKENS = 4000
+
+
+def classify_question(question: str) -> str:
+    """Bucket a chat question as ``draft``, ``explain`` or ``fact`` by keyword."""
+
+    if _DRAFT_QUESTION.search(question):
+        return "draft"
+    if _HOW_QUESTION.search(question):
+        return "explain"
+    return "fact"
+
+
+def estimate_answer_tokens(question: str | Sequence[str]) -> int:
+    """Return the ``max_tokens`` cap for one question or a numbered batch of them."""
+
+    if isinstance(question, str):
+        return ANSWER_TOKEN_BUDGETS[classify_question(question)]
+    total = sum(ANSWER_TOKEN_BUDGETS[classify_question(q)] for q in question)
+    return min(total, MAX_BATCHED_ANSWER_TOKENS)
+
+
+# Short advisory answers don't need the larger model; drafting can opt into it.
+GOVERNANCE_MODEL_ENV = "RAI_TOOLKIT_GOVERNANCE_MODEL"
+DEFAULT_GOVERNANCE_MODEL = "gpt-4o-mini"
+DRAFTING_MODEL = "gpt-4o"
+
+
+def select_governance_model(question: str | Sequence[str], upgrade_drafting: bool = False) -> str:
+    """Pick the chat model: the configured default, or gpt-4o for opted-in drafting."""
+
+    questions = [question] if isinstance(question, str) else question
+    if upgrade_drafting and any(classify_question(q) == "draft" for q in questions):
+        return DRAFTING_MODEL
+    return os.getenv(GOVERNANCE_MODEL_ENV, DEFAULT_GOVERNANCE_MODEL)
+
+
+# Structured output keeps citations and caveats out of the prose so the answer
+# stays short; ``answer`` comes first so it can be streamed as it is generated.
+GOVERNANCE_ANSWER_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "governance_answer",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answer": {"type": "string"},
+                "citations": {"type": "array", "items": {"type": "string"}},
+                "caveats": {"type": "string"},
+            },
+            "required": ["answer", "citations", "caveats"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_ANSWER_OPENING = re.compile(r'"answer"\s*:\s*"')
+_PARTIAL_UNICODE_ESCAPE = re.compile(r"(?<!\\)((?:\\\\)*)\\u[0-9a-fA-F]{0,3}$")
+
+
+def _decodable_prefix(raw: str) -> str:
+    """Trim a trailing, still-incomplete escape sequence from a JSON string body."""
+
+    match = _PARTIAL_UNICODE_ESCAPE.search(raw)
+    if match:
+        return raw[: match.start() + len(match.group(1))]
+    trailing = len(raw) - len(raw.rstrip("\\"))
+    return raw[:-1] if trailing % 2 else raw
+
+
+def _closing_quote(raw: str) -> int:
+    """Return the index of the first unescaped quote in ``raw``, or -1."""
+
+    escaped = False
+    for index, char in enumerate(raw):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            return index
+    return -1
+
+
+def format_answer_extras(payload: Dict[str, Any]) -> str:
+    """Render the citations and caveats that follow a streamed answer."""
+
+    parts = []
+    citations = [c for c in payload.get("citations") or [] if c]
+    if citations:
+        parts.append("**Citations:**\n" + "\n".join(f"- {c}" for c in citations))
+    if payload.get("caveats"):
+        parts.append(f"*Caveats: {payload['caveats']}*")
+    return "".join(f"\n\n{part}" for part in parts)
+
+
+def stream_structured_answer(chunks: Iterable[str]) -> Iterator[str]:
+    """Yield the ``answer`` text of a streamed governance JSON object as it arrives.
+
+    Citations and caveats are yielded as one Markdown block once the object is
+    complete. Output that never opens an ``answer`` string is passed through.
+    """
+
+    buffer = ""
+    start = -1
+    emitted = ""
+    answer_done = False
+
+    for chunk in chunks:
+        buffer += chunk
+        if answer_done:
+            continue
+        if start < 0:
+            match = _ANSWER_OPENING.search(buffer)
+            if not match:
+                continue
+            start = match.end()
+
+        raw = buffer[start:]
+        end = _closing_quote(raw)
+        if end >= 0:
+            raw, answer_done = raw[:end], True
+        else:
+            raw = _decodable_prefix(raw)
+
+        decoded = json.loads(f'"{raw}"')
+        if not answer_done and decoded and "\ud800" <= decoded[-1] <= "\udbff":
+            decoded = decoded[:-1]  # wait for the low half of a surrogate pair
+        if len(decoded) > len(emitted):
+            yield decoded[len(emitted):]
+            emitted = decoded
+
+    if start < 0:
+        if buffer:
+            yield buffer
+        return
+
+    try:
+        payload = json.loads(buffer)
+    except ValueError:
+        return  # truncated (e.g. max_tokens); keep the answer streamed so far
+    extras = format_answer_extras(payload)
+    if extras:
+        yield extras
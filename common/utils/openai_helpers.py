@@ -2,12 +2,41 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 from pydantic import BaseModel
 
 
+@functools.lru_cache(maxsize=1)
+def get_openai_class() -> type | None:
+    """Import the OpenAI client class on first use; None if the package is missing.
+
+    The import stays out of module load so cold starts only pay for it when an
+    API call is made, and later calls skip the import machinery entirely.
+    """
+    try:
+        from openai import OpenAI
+    except ImportError:
+        return None
+    return OpenAI
+
+
+@functools.lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> Any:
+    """Return a shared client per API key, or None if the package is missing.
+
+    Reusing the client keeps its HTTP connection pool warm, so consecutive calls
+    skip the TCP/TLS handshake. OpenAI clients are safe to share across threads.
+    """
+    OpenAI = get_openai_class()
+    if OpenAI is None:
+        return None
+    return OpenAI(api_key=api_key)
+
+
 def safe_openai_call(
     messages: list[Dict[str, str]],
     *,
@@ -48,16 +77,13 @@ def safe_openai_call(
         }
     
     # Try API call with retry/backoff
-    try:
-        from openai import OpenAI
-    except ImportError:
+    client = get_openai_client(api_key)
+    if client is None:
         return {
             "success": False,
             "error": "OpenAI package not installed. Enable 'Demo mode' to continue."
         }
     
-    client = OpenAI(api_key=api_key)
-    
     for attempt in range(max_retries + 1):
         try:
             if response_format:
@@ -109,10 +135,162 @@ def safe_openai_call(
     }
 
 
+def build_batch_jsonl(
+    requests: Sequence[tuple[str, list[Dict[str, str]]]],
+    *,
+    model: str = "gpt-4o",
+    temperature: float = 0.2,
+    max_tokens: int | Dict[str, int] | None = None,
+) -> str:
+    """
+    Serialize chat requests into the JSONL format expected by the Batch API.
+    
+    Args:
+        requests: Sequence of (custom_id, messages) pairs
+        model: OpenAI model name
+        temperature: Sampling temperature
+        max_tokens: Optional completion cap, either one for every request or a
+            per-custom_id mapping
+    
+    Returns:
+        One JSON object per line targeting /v1/chat/completions
+    """
+    lines = []
+    for custom_id, messages in requests:
+        body: Dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+        }
+        cap = max_tokens.get(custom_id) if isinstance(max_tokens, dict) else max_tokens
+        if cap is not None:
+            body["max_tokens"] = cap
+        lines.append(json.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }))
+    return "\n".join(lines) + "\n"
+
+
+def submit_chat_batch(
+    requests: Sequence[tuple[str, list[Dict[str, str]]]],
+    *,
+    model: str = "gpt-4o",
+    temperature: float = 0.2,
+    max_tokens: int | Dict[str, int] | None = None,
+    demo_mode: bool = False,
+    api_key: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Queue chat requests on the OpenAI Batch API (half price, 24h window).
+    
+    Returns:
+        Dict with either:
+        - {"success": True, "batch_id": str} on success
+        - {"success": False, "error": error_message} on failure
+    """
+    if demo_mode:
+        return {"success": False, "error": "Batch processing is unavailable in demo mode."}
+    
+    if not api_key:
+        return {"success": False, "error": "No API key provided."}
+    
+    client = get_openai_client(api_key)
+    if client is None:
+        return {"success": False, "error": "OpenAI package not installed."}
+    
+    payload = build_batch_jsonl(
+        requests, model=model, temperature=temperature, max_tokens=max_tokens
+    )
+    
+    try:
+        batch_file = client.files.create(
+            file=("batch_requests.jsonl", payload.encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+    except Exception as e:
+        return {"success": False, "error": f"OpenAI Batch API error: {str(e)}"}
+    
+    return {"success": True, "batch_id": batch.id}
+
+
+def retrieve_chat_batch(batch_id: str, *, api_key: str | None = None) -> Dict[str, Any]:
+    """
+    Check a queued batch and collect its answers once it has completed.
+    
+    Returns:
+        Dict with either:
+        - {"success": True, "status": str, "data": {custom_id: content}} (data is
+          empty until status == "completed")
+        - {"success": False, "error": error_message} on failure
+    """
+    if not api_key:
+        return {"success": False, "error": "No API key provided."}
+    
+    client = get_openai_client(api_key)
+    if client is None:
+        return {"success": False, "error": "OpenAI package not installed."}
+    
+    try:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            return {"success": True, "status": batch.status, "data": {}}
+        output = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        return {"success": False, "error": f"OpenAI Batch API error: {str(e)}"}
+    
+    return {"success": True, "status": batch.status, "data": parse_batch_output(output)}
+
+
+def parse_batch_output(output: str) -> Dict[str, str]:
+    """Map each batch output line's custom_id to its assistant message content."""
+    results: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        choices = (response.get("body") or {}).get("choices") or []
+        if choices:
+            results[record["custom_id"]] = choices[0]["message"]["content"]
+        else:
+            error = record.get("error") or {}
+            results[record["custom_id"]] = f"❌ {error.get('message', 'No response returned')}"
+    return results
+
+
 def _get_demo_response(response_format: type[BaseModel] | None) -> Dict[str, Any]:
     """
     Generate canned demo response based on expected format.
     """
+    # For InterviewTurnResult (from ai_interviewer.py): answers accepted, analysis attached
+    if response_format and "InterviewTurnResult" in str(response_format):
+        from .ai_interviewer import InterviewResponse, InterviewTurnResult
+        from .ai_parser import ScenarioAnalysis
+        
+        demo_turn = InterviewTurnResult(
+            interview=InterviewResponse(
+                needs_clarification=False,
+                reasoning="Demo mode: The answers cover the critical gaps for a demonstration assessment",
+                ready_for_analysis=True,
+            ),
+            analysis=_get_demo_response(ScenarioAnalysis)["data"],
+        )
+        
+        return {
+            "success": True,
+            "data": demo_turn,
+            "model": "demo-mode",
+            "temperature": 0.0,
+        }
+    
     # For ScenarioAnalysis (from ai_parser.py)
     if response_format and "ScenarioAnalysis" in str(response_format):
         from .ai_parser import ScenarioAnalysis
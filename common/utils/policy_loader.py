@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+import pydantic
 import yaml
 from jsonschema import Draft7Validator, ValidationError
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from .risk_engine import RiskInputs
+
 
 class WhenClause(BaseModel):
     """Conditional metadata describing when to recommend a control."""
@@ -58,6 +66,17 @@ class PolicyControl(BaseModel):
             return []
         return list(value)
 
+    # Display strings are built once per loaded control and reused on every render.
+    @functools.cached_property
+    def tags_text(self) -> str:
+        return ", ".join(self.tags) if self.tags else "None"
+
+    @functools.cached_property
+    def mappings_text(self) -> str:
+        if not self.mappings:
+            return ""
+        return ", ".join(f"{key}: {', '.join(values)}" for key, values in self.mappings.items())
+
 
 class PolicyPack(BaseModel):
     """A validated policy pack sourced from YAML."""
@@ -80,7 +99,7 @@ class ScenarioContext(BaseModel):
     high_stakes: bool = False
     autonomy_level: int = Field(default=0, ge=0)
     sector: str = "General"
-    modifiers: List[str] = Field(default_factory=list)
+    modifiers: Tuple[str, ...] = ()
     
     # Extended risk factors (for policy matching)
     model_type: str = "Traditional ML"
@@ -92,9 +111,38 @@ class ScenarioContext(BaseModel):
     generates_synthetic_content: bool = False
     dual_use_risk: str = "None"
     decision_reversible: str = "Fully Reversible"
-    protected_populations: List[str] = Field(default_factory=list)
+    protected_populations: Tuple[str, ...] = ()
 
-    model_config = ConfigDict(extra="forbid", protected_namespaces=())
+    # Frozen (with tuple collections) so contexts are hashable cache keys.
+    model_config = ConfigDict(extra="forbid", protected_namespaces=(), frozen=True)
+
+
+@functools.lru_cache(maxsize=128)
+def build_scenario_context(inputs: RiskInputs, tier: str) -> ScenarioContext:
+    """Translate risk inputs into the structure used by the selector.
+
+    Both models are frozen, so identical inputs share one cached instance.
+    """
+
+    return ScenarioContext(
+        tier=tier,
+        contains_pii=inputs.contains_pii,
+        customer_facing=inputs.customer_facing,
+        high_stakes=inputs.high_stakes,
+        autonomy_level=inputs.autonomy_level,
+        sector=inputs.sector,
+        modifiers=inputs.modifiers,
+        model_type=inputs.model_type,
+        data_source=inputs.data_source,
+        learns_in_production=inputs.learns_in_production,
+        international_data=inputs.international_data,
+        explainability_level=inputs.explainability_level,
+        uses_foundation_model=inputs.uses_foundation_model,
+        generates_synthetic_content=inputs.generates_synthetic_content,
+        dual_use_risk=inputs.dual_use_risk,
+        decision_reversible=inputs.decision_reversible,
+        protected_populations=inputs.protected_populations,
+    )
 
 
 def load_policy_pack(path: Path) -> PolicyPack:
@@ -116,6 +164,75 @@ def load_policy_packs(directory: Path) -> List[PolicyPack]:
     return packs
 
 
+DEFAULT_PACK_CACHE_DIR = Path.home() / ".rai_toolkit_cache"
+
+
+@functools.lru_cache(maxsize=1)
+def _pack_model_salt() -> str:
+    """Identify the pack model schema and pydantic version a pickle was written with."""
+
+    schema = json.dumps(PolicyPack.model_json_schema(), sort_keys=True)
+    return f"{pydantic.VERSION}:{pickle.HIGHEST_PROTOCOL}:{schema}"
+
+
+def policy_packs_fingerprint(directory: Path) -> str:
+    """Hash pack file names, sizes, and mtimes so edits invalidate the cache.
+
+    The pack model schema and pydantic version are mixed in as well, so pickles
+    written by an older version of the models are never loaded.
+    """
+
+    digest = hashlib.sha256(_pack_model_salt().encode("utf-8"))
+    for path in sorted(directory.glob("*.yaml")):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_policy_packs_cached(
+    directory: Path, cache_dir: Path | None = None
+) -> List[PolicyPack]:
+    """Load policy packs, reusing a pickled copy when the YAML is unchanged.
+
+    Cold starts skip YAML parsing and validation when a pickle matching the
+    current pack fingerprint exists. Cache failures fall back to a fresh load.
+    """
+
+    cache_dir = cache_dir or DEFAULT_PACK_CACHE_DIR
+    cache_path = cache_dir / f"packs-{policy_packs_fingerprint(directory)}.pkl"
+
+    try:
+        with cache_path.open("rb") as handle:
+            cached = pickle.load(handle)
+    except Exception:
+        cached = None  # Missing or corrupt pickles can fail in many ways; reload instead
+    if isinstance(cached, list) and all(isinstance(pack, PolicyPack) for pack in cached):
+        return cached
+
+    packs = load_policy_packs(directory)
+
+    tmp_name = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see a partial pickle.
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as handle:
+            tmp_name = handle.name
+            pickle.dump(packs, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+        # Pickles for earlier fingerprints can never match again.
+        for stale in cache_dir.glob("packs-*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        pass  # The warm start is optional; the freshly loaded packs are still valid
+    finally:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+    return packs
+
+
 def control_matches(control: PolicyControl, scenario: ScenarioContext) -> bool:
     """Return True when a control's conditions align with the scenario."""
 
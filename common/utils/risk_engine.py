@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -78,6 +78,11 @@ PROTECTED_POPULATION_WEIGHTS: Dict[str, int] = {
     "Healthcare Vulnerable": 2,
 }
 
+# Gating lookups used by the escalation and stop-ship checks.
+BIOMETRIC_KEYWORDS: Tuple[str, ...] = ("biometric", "facial recognition", "emotion recognition", "gait analysis")
+STOP_SHIP_PROTECTED_GROUPS: FrozenSet[str] = frozenset({"Children", "Elderly", "People with Disabilities"})
+HIGH_DUAL_USE_LEVELS: FrozenSet[str] = frozenset({"High (Weaponization)", "Export Control"})
+
 
 class RiskInputs(BaseModel):
     """Scenario attributes that influence the additive risk score."""
@@ -88,7 +93,7 @@ class RiskInputs(BaseModel):
     high_stakes: bool = False
     autonomy_level: int = Field(default=0, ge=0, le=3)
     sector: str = "General"
-    modifiers: List[str] = Field(default_factory=list)
+    modifiers: Tuple[str, ...] = ()
     
     # Technical AI/ML risks
     model_type: str = "Traditional ML"
@@ -108,9 +113,10 @@ class RiskInputs(BaseModel):
     
     # Rights & equity
     decision_reversible: str = "Fully Reversible"
-    protected_populations: List[str] = Field(default_factory=list)
+    protected_populations: Tuple[str, ...] = ()
 
-    model_config = ConfigDict(extra="forbid", protected_namespaces=())
+    # Frozen (with tuple collections) so inputs are hashable cache keys.
+    model_config = ConfigDict(extra="forbid", protected_namespaces=(), frozen=True)
 
 
 @dataclass
@@ -260,10 +266,9 @@ def check_sensitive_use_gating(inputs: RiskInputs, assessment: RiskAssessment) -
     
     # Biometric identification + real-time classification = Restricted use
     # (EU AI Act Annex III, Article 5 considerations)
-    biometric_keywords = ["biometric", "facial recognition", "emotion recognition", "gait analysis"]
     if inputs.customer_facing and inputs.high_stakes:
         # Check modifiers for biometric indicators (simplified for demo)
-        if any(keyword in str(inputs.modifiers).lower() for keyword in biometric_keywords):
+        if any(keyword in str(inputs.modifiers).lower() for keyword in BIOMETRIC_KEYWORDS):
             escalation_flags.append("Biometric identification in customer-facing, high-stakes context")
             approval_level = "Restricted Use Review + Legal Sign-Off"
     
@@ -279,7 +284,7 @@ def check_sensitive_use_gating(inputs: RiskInputs, assessment: RiskAssessment) -
         approval_level = "Executive + Legal + Ethics Review"
     
     # Dual-use risk at Critical tier
-    if inputs.dual_use_risk in ["High (Weaponization)", "Export Control"]:
+    if inputs.dual_use_risk in HIGH_DUAL_USE_LEVELS:
         if assessment.tier in ["High", "Critical"]:
             escalation_flags.append(f"Dual-use risk: {inputs.dual_use_risk}")
             approval_level = "National Security + Legal Review"
@@ -330,15 +335,14 @@ def check_stop_ship_triggers(
         )
     
     # Rule 2: Critical + Protected Populations
-    protected_groups = ["Children", "Elderly", "People with Disabilities"]
     if assessment.tier == "Critical" and inputs.protected_populations:
-        if any(group in inputs.protected_populations for group in protected_groups):
+        if not STOP_SHIP_PROTECTED_GROUPS.isdisjoint(inputs.protected_populations):
             triggered_rules.append(
                 "**Critical + Protected Populations:** Accessibility audit (WCAG 2.1 AA), bias testing, civil rights consultation required (ADA, COPPA)"
             )
     
     # Rule 3: Critical + High Dual-Use Risk
-    if assessment.tier == "Critical" and inputs.dual_use_risk in ["High (Weaponization)", "Export Control"]:
+    if assessment.tier == "Critical" and inputs.dual_use_risk in HIGH_DUAL_USE_LEVELS:
         triggered_rules.append(
             "**Critical + High Dual-Use:** Export control classification, red team testing, restricted access controls required (EAR/ITAR)"
         )
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import collections
 import html
+import os
 import sys
+import textwrap
+import threading
+import types
+from datetime import date
 from pathlib import Path
-from typing import List
+from typing import Iterator, Optional, Sequence
 
 import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
@@ -15,153 +23,603 @@ if str(REPO_ROOT) not in sys.path:
     # repository root so the shared ``common`` package resolves without installs.
     sys.path.append(str(REPO_ROOT))
 
-from common.utils.ai_parser import (
-    format_analysis_summary,
-    parse_scenario_with_ai,
+# OpenAI-backed helpers and the Jinja exporters are imported inside the
+# functions that use them so cold starts only pay for them when needed.
+from common.utils.governance_qa import (
+    GOVERNANCE_ANSWER_FORMAT,
+    GOVERNANCE_SYSTEM_PREAMBLE,
+    build_governance_context,
+    estimate_answer_tokens,
+    format_numbered_questions,
+    select_governance_model,
+    stream_structured_answer,
 )
-from common.utils.ai_interviewer import (
-    conduct_interview,
-    format_interview_questions,
-)
-from common.utils.exporters import build_decision_record
-from common.utils.exporters_transparency_note import build_transparency_note
 from common.utils.policy_loader import (
-    ScenarioContext,
-    load_policy_packs,
+    build_scenario_context,
+    load_policy_packs_cached,
+    policy_packs_fingerprint,
     select_applicable_controls,
 )
 from common.utils.risk_engine import RiskInputs, calculate_risk_score
 
 _POLICY_PACKS_DIR = REPO_ROOT / "common" / "policy_packs"
 
+_CHAT_VISIBLE_MESSAGES = 10
+_CHAT_BATCH_MAX = 5
+_ANSWER_CACHE_MAX = 32
 
-@st.cache_data(show_spinner=False)
-def _load_packs():
-    """Load policy packs once per session to keep the UI responsive."""
-
-    return load_policy_packs(_POLICY_PACKS_DIR)
-
-
-def _build_scenario_context(inputs: RiskInputs, tier: str) -> ScenarioContext:
-    """Translate form inputs into the structure used by the selector."""
-
-    return ScenarioContext(
-        tier=tier,
-        contains_pii=inputs.contains_pii,
-        customer_facing=inputs.customer_facing,
-        high_stakes=inputs.high_stakes,
-        autonomy_level=inputs.autonomy_level,
-        sector=inputs.sector,
-        modifiers=list(inputs.modifiers),
-        model_type=inputs.model_type,
-        data_source=inputs.data_source,
-        learns_in_production=inputs.learns_in_production,
-        international_data=inputs.international_data,
-        explainability_level=inputs.explainability_level,
-        uses_foundation_model=inputs.uses_foundation_model,
-        generates_synthetic_content=inputs.generates_synthetic_content,
-        dual_use_risk=inputs.dual_use_risk,
-        decision_reversible=inputs.decision_reversible,
-        protected_populations=inputs.protected_populations,
-    )
+# Badge colours for the "Governance Standards Applied" strip.
+_STANDARD_COLORS = types.MappingProxyType({
+    "NIST AI RMF": "#0066cc",
+    "EU AI Act": "#003399",
+    "ISO/IEC 42001": "#006600",
+    "OWASP LLM Top 10": "#cc0000",
+    "MITRE ATLAS": "#990000",
+    "US OMB M-24-10": "#4d4d4d",
+})
+
+# Speaker labels used in the exported Q&A transcript.
+_CHAT_ROLE_LABELS = types.MappingProxyType({
+    "user": "**You:**",
+    "assistant": "**Governance Advisor:**",
+})
+
+# Read-only lookup shared by the preview, refinement and scoring sections.
+_RISK_TIER_ICONS = types.MappingProxyType({
+    "Low": "🟢",
+    "Medium": "🟡",
+    "High": "🟠",
+    "Critical": "🔴",
+})
 
 
-def _get_governance_answer(question: str, use_case: str, assessment, controls, ai_analysis, api_key: str) -> str:
-    """Get context-aware governance answers using OpenAI."""
+def _api_key() -> Optional[str]:
+    """Read the OpenAI key from Streamlit secrets; None when missing or unreadable.
+
+    Read on each run rather than cached, so a key added after startup is picked up.
+    """
+
     try:
-        from openai import OpenAI
-    except ImportError:
-        return "❌ OpenAI package not installed. This feature requires the openai package."
-    
-    # Build context from the assessment
-    risk_factors_text = ", ".join(assessment.contributing_factors) if assessment.contributing_factors else "None"
-    
-    controls_text = ""
-    if controls:
-        for i, control in enumerate(controls[:5], 1):  # Top 5 safeguards
-            controls_text += f"{i}. **{control.title}** ({control.authority} {control.clause}): {control.description}\n"
-    else:
-        controls_text = "No specific safeguards triggered for this risk profile."
-    
-    frameworks_text = ai_analysis.framework_alignment if hasattr(ai_analysis, 'framework_alignment') else "General AI governance frameworks"
-    
-    # Build comprehensive system prompt
-    system_prompt = f"""You are an expert AI governance advisor helping teams understand their risk assessment results and implement safeguards.
+        return st.secrets.get("OPENAI_API_KEY")
+    except Exception:
+        return None
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_packs(packs_version: str):
+    """Load policy packs once per YAML fingerprint; callers must treat them as read-only."""
+
+    return load_policy_packs_cached(_POLICY_PACKS_DIR)
+
+
+# Scores and controls are pure functions of RiskInputs and the pack
+# fingerprint, so reruns with unchanged inputs are served from the cache. Large
+# derived objects are passed as underscore arguments Streamlit doesn't hash.
+def _risk_inputs_from_analysis(ai_analysis) -> RiskInputs:
+    """Project the AI analysis onto the fields the risk engine scores."""
+
+    return RiskInputs(
+        contains_pii=ai_analysis.contains_pii,
+        customer_facing=ai_analysis.customer_facing,
+        high_stakes=ai_analysis.high_stakes,
+        autonomy_level=ai_analysis.autonomy_level,
+        sector=ai_analysis.sector,
+        modifiers=tuple(ai_analysis.modifiers),
+        model_type=ai_analysis.model_type,
+        data_source=ai_analysis.data_source,
+        learns_in_production=ai_analysis.learns_in_production,
+        international_data=ai_analysis.international_data,
+        explainability_level=ai_analysis.explainability_level,
+        uses_foundation_model=ai_analysis.uses_foundation_model,
+        generates_synthetic_content=ai_analysis.generates_synthetic_content,
+        dual_use_risk=ai_analysis.dual_use_risk,
+        decision_reversible=ai_analysis.decision_reversible,
+        protected_populations=tuple(ai_analysis.protected_populations),
+    )
 
-**CURRENT ASSESSMENT CONTEXT:**
 
-**Scenario:** {use_case}
+@st.cache_data(show_spinner=False, max_entries=256)
+def _score_and_select(packs_version: str, risk_inputs: RiskInputs, _packs):
+    """Return ``(assessment, scenario_context, controls)`` once per inputs and pack fingerprint."""
+
+    assessment = calculate_risk_score(risk_inputs)
+    scenario_context = build_scenario_context(risk_inputs, assessment.tier)
+    return assessment, scenario_context, select_applicable_controls(_packs, scenario_context)
 
-**Risk Classification:**
-- Tier: {assessment.tier}
-- Score: {assessment.score} points
-- Key Risk Factors: {risk_factors_text}
 
-**Applicable Governance Frameworks:** {frameworks_text}
+_BADGE_FMT = '<span style="background-color: %s; color: white; padding: 4px 12px; border-radius: 12px; margin: 4px; display: inline-block; font-size: 0.85em;">%s</span>'
+_DEFAULT_BADGE_COLOR = "#666666"
 
-**Top Safeguards Required:**
-{controls_text}
 
-**AI Analysis Reasoning:** {ai_analysis.reasoning if hasattr(ai_analysis, 'reasoning') else 'Not available'}
+def _badge_span(authority: str) -> str:
+    """Render a single colour-coded authority badge."""
 
----
+    return _BADGE_FMT % (_STANDARD_COLORS.get(authority, _DEFAULT_BADGE_COLOR), authority)
 
-**YOUR ROLE:**
-You are a helpful governance advisor who:
-- Explains WHY specific safeguards are required (citing regulations)
-- Clarifies technical governance concepts in plain language
-- Provides actionable implementation guidance
-- Helps draft communications to legal/compliance/security teams
-- References the SPECIFIC assessment details above in your answers
 
-**GUIDELINES:**
-1. **Be specific:** Always reference the actual scenario, risk tier, and safeguards from THIS assessment
-2. **Be practical:** Provide concrete next steps, not just theory
-3. **Cite sources:** Mention specific regulations (GDPR Art. 22, HIPAA 164.308, EU AI Act Art. 52, etc.)
-4. **Be concise:** 2-3 paragraphs max unless asked for detailed explanation
-5. **Caveat appropriately:** Remind users to validate with legal/compliance when making decisions
+# Known authorities are formatted once at import; only unknown ones are built per call.
+_STANDARD_BADGES = types.MappingProxyType({auth: _badge_span(auth) for auth in _STANDARD_COLORS})
 
-**EXAMPLE RESPONSE STYLES:**
 
-For "Why" questions:
-- Explain the specific risk factors that led to the tier/safeguard
-- Connect to regulatory requirements
-- Use this assessment's details
+@st.cache_data(show_spinner=False, max_entries=64)
+def _badges_html(authorities: frozenset) -> str:
+    """Render one colour-coded badge per authority, alphabetically."""
+
+    return " ".join(
+        _STANDARD_BADGES.get(auth) or _badge_span(auth)
+        for auth in sorted(authorities)
+    )
 
-For "How" questions:
-- Provide step-by-step implementation guidance
-- Suggest tools/frameworks when relevant
-- Include success criteria
 
-For "Draft" requests:
-- Use professional but clear language
-- Include specific details from this scenario
-- Provide structure (subject line, sections, next steps)
+@st.cache_data(show_spinner=False, max_entries=256)
+def _markdown_list(items: tuple, numbered: bool = False) -> str:
+    """Join ``items`` into a single Markdown list, preserving their order."""
 
-For framework questions:
-- Explain the regulation in plain language
-- Show how it applies to THIS scenario
-- Provide compliance checklist
+    if numbered:
+        return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _governance_system_prompt(use_case: str, assessment, controls, ai_analysis) -> str:
+    """Assemble the static preamble plus the cached assessment context.
+
+    Chat turns reuse the same assessment and analysis objects, so the finished
+    prompt is kept with the session's objects and returned byte-identical while
+    they last.
+    """
+
+    session_objects = _session_objects()
+    cached = session_objects.get("gov_system_prompt")
+    if cached and cached[0] is assessment and cached[1] is ai_analysis and cached[2] == use_case:
+        return cached[3]
+
+    # ScenarioAnalysis defaults both fields, and main() drops outdated analyses
+    # before anything renders, so they can be read directly.
+    frameworks_text = ai_analysis.framework_alignment
+    reasoning = ai_analysis.reasoning
+
+    # Only the assessment context varies between turns; the preamble is shared.
+    context_block = build_governance_context(
+        use_case,
+        assessment.tier,
+        assessment.score,
+        tuple(assessment.contributing_factors),
+        tuple(
+            (control.title, control.authority, control.clause, control.description)
+            for control in controls[:5]  # Top 5 safeguards
+        ),
+        frameworks_text,
+        reasoning,
+    )
+    system_prompt = "".join([GOVERNANCE_SYSTEM_PREAMBLE, context_block])
+    session_objects["gov_system_prompt"] = (assessment, ai_analysis, use_case, system_prompt)
+    return system_prompt
 
-**IMPORTANT:** Always answer in the context of the current assessment shown above. Don't give generic governance advice - make it specific to this {assessment.tier} tier scenario with score {assessment.score}."""
+
+def _get_governance_answer(question: str | Sequence[str], use_case: str, assessment, controls, ai_analysis, api_key: str) -> Iterator[str]:
+    """Stream context-aware governance answers from OpenAI, chunk by chunk.
+
+    Passing a list of questions sends them in one request (system prompt billed
+    once) and asks for one labeled section per question.
+    """
+    from common.utils.openai_helpers import get_openai_client
+
+    client = get_openai_client(api_key)
+    if client is None:
+        yield "❌ OpenAI package not installed. This feature requires the openai package."
+        return
+    
+    system_prompt = _governance_system_prompt(use_case, assessment, controls, ai_analysis)
+
+    if isinstance(question, str):
+        user_message = question
+    else:
+        user_message = (
+            f"Answer each of the following {len(question)} questions separately. "
+            "Start each answer with a heading '### <number>. <short title>' and keep the same order.\n\n"
+            + format_numbered_questions(question)
+        )
 
     try:
-        client = OpenAI(api_key=api_key)
-        
         response = client.chat.completions.create(
-            model="gpt-4o",
+            model=select_governance_model(question, st.session_state.get("governance_draft_upgrade", False)),
             messages=[
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": question}
+                {"role": "user", "content": user_message}
             ],
             temperature=0.7,  # Slightly higher for more conversational responses
-            max_tokens=800,  # Allow detailed responses
+            max_tokens=estimate_answer_tokens(question),  # sized to the kind of question
+            response_format=GOVERNANCE_ANSWER_FORMAT,
+            stream=True,  # First tokens render while the rest is generated
         )
         
-        return response.choices[0].message.content
+        deltas = (
+            chunk.choices[0].delta.content
+            for chunk in response
+            if chunk.choices and chunk.choices[0].delta.content
+        )
+        yield from stream_structured_answer(deltas)
         
     except Exception as e:
-        return f"❌ Error getting response: {str(e)}\n\nPlease check your API key and try again."
+        yield f"❌ Error getting response: {str(e)}\n\nPlease check your API key and try again."
+
+
+def _queue_safeguard_rationales(use_case: str, assessment, controls, ai_analysis, api_key, demo_mode: bool) -> dict:
+    """Submit one rationale request per top safeguard as a single Batch API job."""
+    from common.utils.openai_helpers import submit_chat_batch
+
+    system_prompt = _governance_system_prompt(use_case, assessment, controls, ai_analysis)
+    questions = {
+        control.id: f"Explain why the safeguard '{control.title}' ({control.authority} {control.clause}) is required for this scenario and how to implement it."
+        for control in controls[:5]
+    }
+    return submit_chat_batch(
+        [
+            (control_id, [{"role": "system", "content": system_prompt}, {"role": "user", "content": question}])
+            for control_id, question in questions.items()
+        ],
+        model=select_governance_model(list(questions.values()), st.session_state.get("governance_draft_upgrade", False)),
+        temperature=0.7,
+        max_tokens={control_id: estimate_answer_tokens(question) for control_id, question in questions.items()},
+        demo_mode=demo_mode,
+        api_key=api_key,
+    )
+
+
+@st.fragment(run_every="30s")
+def _render_rationale_batch_status(controls, api_key) -> None:
+    """Poll the queued rationale batch and offer the bundle once it completes."""
+    from common.utils.openai_helpers import retrieve_chat_batch
+
+    batch_id = st.session_state.get("rationale_batch_id")
+    if not batch_id:
+        # A batch that ended without output stays reported until a new one is queued
+        if st.session_state.get("rationale_batch_error"):
+            st.error(st.session_state.rationale_batch_error)
+        return
+
+    results = st.session_state.get("rationale_batch_results")
+    if results is None:
+        status = retrieve_chat_batch(batch_id, api_key=api_key)
+        if not status["success"]:
+            st.error(f"⚠️ {status['error']}")
+            return
+        if status["status"] in ("failed", "expired", "cancelled"):
+            error = f"❌ Safeguard rationale batch `{batch_id}` {status['status']}. Generate the bundle again to retry."
+        elif status["status"] != "completed":
+            st.caption(f"⏳ Safeguard rationale batch `{batch_id}`: {status['status']} (checks every 30s)")
+            return
+        elif not status["data"]:
+            error = f"❌ Safeguard rationale batch `{batch_id}` completed without any output."
+        else:
+            error = None
+
+        if error:
+            # Terminal: stop polling and keep the message visible
+            st.session_state.rationale_batch_id = None
+            st.session_state.rationale_batch_error = error
+            st.error(error)
+            return
+        results = status["data"]
+        st.session_state.rationale_batch_results = results
+
+    titles = {control.id: f"{control.title} — {control.authority}" for control in controls}
+    bundle = "# Safeguard Rationales\n\n" + "\n\n".join(
+        f"## {titles.get(control_id, control_id)}\n\n{content}"
+        for control_id, content in results.items()
+    )
+    st.download_button(
+        label="📥 Download Safeguard Rationales",
+        data=bundle,
+        file_name="safeguard_rationales.md",
+        mime="text/markdown",
+        use_container_width=True,
+    )
+
+
+_INTERVIEW_HISTORY_TURNS = 20
+
+
+@st.cache_resource(show_spinner=False)
+def _session_store() -> types.SimpleNamespace:
+    """Process-wide home for large per-session objects, keyed by session id.
+
+    Every session's script thread shares it, so reads and writes of ``objects``
+    hold ``lock``; the lock lives here because the script's own globals are
+    rebuilt on each rerun.
+    """
+
+    return types.SimpleNamespace(objects={}, lock=threading.Lock())
+
+
+def _session_objects() -> dict:
+    """Return this session's analysis objects without routing them through session_state."""
+
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else ""
+    store = _session_store()
+    with store.lock:
+        objects = store.objects.get(session_id)
+        if objects is None:
+            objects = store.objects[session_id] = {"ai_analysis": None, "interview_questions": None}
+            # Streamlit has no session-end hook, so each new session sweeps out the ones
+            # the runtime has closed. Disconnected sessions stay in its session storage
+            # until they expire so users can reconnect, and their objects are kept too.
+            # This relies on the private Runtime._session_mgr; without it nothing is swept.
+            session_mgr = getattr(runtime.get_instance(), "_session_mgr", None) if runtime.exists() else None
+            if session_mgr is not None:
+                for sid in list(store.objects):
+                    if sid != session_id and session_mgr.get_session_info(sid) is None:
+                        del store.objects[sid]
+    return objects
+
+
+def _reset_interview_state() -> None:
+    """Start an empty interview transcript and its formatted Q&A text.
+
+    Both keep the same last ``_INTERVIEW_HISTORY_TURNS`` turns, so the interviewer
+    prompt and the enriched analysis input always cover the same answers.
+    """
+
+    st.session_state.interview_history = collections.deque(maxlen=_INTERVIEW_HISTORY_TURNS)
+    st.session_state.enriched_turns = collections.deque(maxlen=_INTERVIEW_HISTORY_TURNS)
+
+
+def _format_interview_turn(turn) -> str:
+    return f"Q: {turn['question']}\nA: {turn['answer']}\n\n"
+
+
+def _record_interview_answers(answers) -> None:
+    """Append a completed round's turns to the history and its formatted text.
+
+    Called only after the round's interview turn succeeds, so resubmitting the
+    form after an error never records the same answers twice.
+    """
+
+    st.session_state.interview_history.extend(answers)
+    st.session_state.enriched_turns.extend(_format_interview_turn(turn) for turn in answers)
+
+
+def _build_enriched_description(description: str, interview_text: str) -> str:
+    """Append the recorded interview Q&A to the original scenario description."""
+
+    return "".join([description, "\n\n**Additional Context from Interview:**\n", interview_text])
+
+
+def _run_interview_turn(description: str, api_key, demo_mode: bool, on_question=None, answers=()):
+    """Return ``(interview_response, analysis)``; analysis is None unless ready.
+
+    ``answers`` are the round being submitted; they are sent after the recorded
+    history but not recorded here. First-round questions are handed to
+    ``on_question`` as they stream in.
+    """
+    from common.utils.ai_interviewer import conduct_follow_up_interview_cached, stream_interview
+
+    history = [*st.session_state.interview_history, *answers][-_INTERVIEW_HISTORY_TURNS:]
+    if not history:
+        # The first round only asks questions
+        return stream_interview(
+            description, on_question or (lambda question: None), api_key=api_key, demo_mode=demo_mode
+        ), None
+
+    # Once answers exist, the readiness decision and the final analysis share one request
+    interview_response, analysis = conduct_follow_up_interview_cached(
+        description, history, api_key, demo_mode
+    )
+    if interview_response and interview_response.ready_for_analysis and analysis is None:
+        # The model marked the interview ready but left the analysis out
+        from common.utils.ai_parser import parse_scenario_with_ai_cached
+
+        enriched_turns = [
+            *st.session_state.enriched_turns,
+            *(_format_interview_turn(turn) for turn in answers),
+        ][-_INTERVIEW_HISTORY_TURNS:]
+        enriched_description = _build_enriched_description(description, "".join(enriched_turns))
+        analysis = parse_scenario_with_ai_cached(enriched_description, api_key=api_key, demo_mode=demo_mode)
+    return interview_response, analysis
+
+
+# Static copy is dedented once at import; reruns just hand the string to Streamlit.
+_ABOUT_MD = textwrap.dedent("""
+    ### What This Is
+    A **demonstration prototype** showing one potential approach to AI risk assessment:
+    - **Triage** AI systems based on impact and context
+    - **Score** risk using transparent, additive factors across 16 dimensions
+    - **Map** scenarios to governance standards (NIST AI RMF, EU AI Act, OWASP, etc.)
+    - **Generate** decision records for stakeholder review
+    
+    ### Risk Level Definitions
+    
+    | Tier | Score Range | Characteristics | Governance Requirements |
+    |------|-------------|-----------------|-------------------------|
+    | 🟢 **Low** | 0-3 | Minimal data, human oversight, reversible decisions | Standard security practices |
+    | 🟡 **Medium** | 4-6 | Some PII/automation, customer-facing | Enhanced monitoring, documentation |
+    | 🟠 **High** | 7-9 | Sensitive data, consequential decisions | Executive review, compliance checks, audit trail |
+    | 🔴 **Critical** | 10+ | Healthcare/Finance + High stakes + Autonomy | Legal review, DPIA, red-team testing, board approval |
+    
+    **Examples:**
+    - **Low:** Internal analytics dashboard (aggregated data only)
+    - **Medium:** Customer support chatbot (suggests responses, human approves)
+    - **High:** Credit approval assistant (recommends decisions with oversight)
+    - **Critical:** Autonomous medical diagnosis system (PHI + life/safety impact)
+    
+    **Scoring:** Risk score is additive based on PII, customer-facing, high-stakes, autonomy level, sector (healthcare/finance/critical infrastructure), and modifiers (bio/cyber/children/disinformation).
+    
+    ### What This Is NOT
+    - ❌ **Not production software** — Intended for educational and demonstrative purposes only
+    - ❌ **Not comprehensive** — A sample implementation, not an enterprise solution
+    - ❌ **Not legal advice** — Always validate with legal, compliance, and security partners
+    - ❌ **Not authoritative** — Framework citations are illustrative examples only
+    
+    ### Assumptions & Limitations
+    **⚠️ All content should be treated as sample/demonstrative use only**
+    
+    - **Scoring weights:** Illustrative, not empirically validated for production use
+    - **Policy packs:** Example YAML files, not official regulatory text
+    - **Framework citations:** Illustrative references, not authoritative legal interpretations
+    - **AI analysis:** Powered by OpenAI API; responses are AI-generated suggestions
+    - **Decision records:** Templates for demonstration, not binding legal documents
+    - **No data storage:** Assessments are session-only and not persisted
+    
+    ### Recommended Use
+    Use this tool to:
+    - Explore governance-as-code concepts
+    - Learn about AI risk frameworks interactively
+    - Generate discussion materials for team conversations
+    - Understand what factors matter for AI governance
+    
+    **Before production deployment:** Engage legal, privacy, security, and compliance teams to validate all requirements.
+    """)
+
+_DATA_HANDLING_MD = textwrap.dedent("""
+    **Your data privacy:**
+    - ✅ **No data stored:** Assessments exist only in your browser session (not saved to database)
+    - ✅ **Session-only:** All data cleared when you close the browser tab
+    - ⚠️ **AI analysis:** Your scenario descriptions and answers are sent to OpenAI's API for analysis
+    
+    **What gets sent to OpenAI:**
+    - Your AI use case description
+    - Your answers to clarifying questions
+    - Any additional context you provide for refinement
+    
+    **What stays local:**
+    - Risk score calculations (computed in browser)
+    - Policy pack matching logic
+    - Decision record generation
+    
+    **Important recommendations:**
+    - ❌ Don't paste real PII/PHI or confidential information
+    - ✅ Use anonymized/hypothetical examples instead
+    - ⚠️ For production assessments, deploy locally or consult legal/privacy teams
+    
+    [OpenAI Terms](https://openai.com/policies/terms-of-use) | [Streamlit Privacy](https://streamlit.io/privacy-policy)
+    """)
+
+_MORE_INFO_MD = textwrap.dedent("""
+    This is an open-source demonstration of governance-as-code patterns.
+    
+    [GitHub Repository](https://github.com/hankthevc/rai-toolkit) | [Report Issues](https://github.com/hankthevc/rai-toolkit/issues) | [Documentation](https://github.com/hankthevc/rai-toolkit/tree/main/docs)
+    """)
+
+_PROMPT_TIPS_MD = textwrap.dedent("""
+    **Include these 6 elements for best AI analysis:**
+    
+    1. **What the AI does** — Core functionality and decision-making role
+    2. **Who uses it** — Internal employees, customers, vulnerable populations, general public
+    3. **What data it processes** — Personal info, health records, financial data, behavioral data
+    4. **Level of automation** — Does it suggest, assist, decide with oversight, or act autonomously?
+    5. **Impact domain** — What happens if it makes a mistake? (safety, rights, finances, privacy)
+    6. **Context flags** — Healthcare, finance, children, cybersecurity, bio/life sciences, disinformation
+    
+    ---
+    
+    ### ✅ Example: Healthcare Chatbot (Critical Risk)
+    
+    *"A chatbot that helps hospital patients schedule appointments and refill prescriptions. It accesses their medical records to check medication history and insurance eligibility. Patients interact directly via web and mobile app. The system suggests appointment times but requires nurse approval for prescription refills."*
+    
+    **Why it's good:** Clear functionality (scheduling/prescriptions), users (patients), data (medical records), automation (suggests with nurse approval), impact (healthcare decisions), context (healthcare).
+    
+    ---
+    
+    ### ✅ Example: Code Copilot (Low Risk)
+    
+    *"An internal code completion tool for our engineering team. It suggests code snippets based on our proprietary codebase. Engineers review all suggestions before committing. Only used by employees with existing code access. No customer data involved."*
+    
+    **Why it's good:** Clear functionality (code suggestions), users (internal engineers), data (code, no customer data), automation (suggestion only), impact (low - human review), context (internal tooling).
+    
+    ---
+    
+    ### ✅ Example: Trading System (Critical Risk)
+    
+    *"An automated trading system that buys and sells securities based on market signals. It executes trades autonomously up to $50K per trade without human review. Larger trades escalate to compliance. Processes real-time market data and client portfolio information."*
+    
+    **Why it's good:** Clear functionality (automated trading), users (implicit: clients), data (portfolio + market data), automation (autonomous up to threshold), impact (financial), context (finance).
+    
+    ---
+    
+    ### ❌ Too Vague Examples
+    
+    - **"A chatbot for customers"** → Missing: What does it do? What data? What decisions? What stakes?
+    - **"AI for hiring"** → Missing: Resume screening? Interview scheduling? Autonomous rejection? What data does it see?
+    - **"Machine learning model"** → Missing: Everything! What's the use case?
+    
+    ---
+    
+    **The AI will analyze your description and suggest risk modifiers. You'll review its reasoning before accepting.**
+    """)
+
+_OWNERS_CRITICAL_HIGH_MD = textwrap.dedent("""
+    - **Product Lead:** Accountable for roadmap delays
+    - **Legal/Privacy:** Sign off on compliance gaps
+    - **Security:** Approve threat model
+    - **Exec Sponsor:** Final go/no-go decision
+    """)
+
+# Owners and immediate next steps per final tier; unknown tiers fall back to "Low".
+_TIER_OWNERS_MD = types.MappingProxyType({
+    "Critical": _OWNERS_CRITICAL_HIGH_MD,
+    "High": _OWNERS_CRITICAL_HIGH_MD,
+    "Medium": textwrap.dedent("""
+        - **Product Lead:** Owns risk acceptance
+        - **Legal or Privacy:** Review data handling
+        - **Engineering Lead:** Validate technical controls
+        """),
+    "Low": textwrap.dedent("""
+        - **Product Lead:** Document decision
+        - **Engineering Lead:** Standard review process
+        """),
+})
+
+_TIER_NEXT_STEPS = types.MappingProxyType({
+    "Critical": (st.error, textwrap.dedent("""
+        🚨 **STOP-SHIP TIER**
+        1. Escalate to exec leadership immediately
+        2. Engage legal, privacy, and security teams
+        3. Conduct formal risk assessment (this is preliminary)
+        4. Do not deploy until all Critical-tier safeguards are in place
+        """)),
+    "High": (st.warning, textwrap.dedent("""
+        ⚠️ **High-Risk - Formal Review Required**
+        1. Schedule legal/compliance review
+        2. Document all safeguards in design doc
+        3. Implement monitoring and audit logging
+        4. Plan for external audit if customer-facing
+        """)),
+    "Medium": (st.info, textwrap.dedent("""
+        ℹ️ **Medium Risk - Standard Process**
+        1. Review recommended safeguards
+        2. Add governance controls to backlog
+        3. Update privacy/security design docs
+        4. Proceed with normal launch process
+        """)),
+    "Low": (st.success, textwrap.dedent("""
+        ✅ **Low Risk - Proceed with Awareness**
+        1. Document this assessment
+        2. Implement basic safeguards
+        3. Monitor for scope changes
+        4. Standard launch process applies
+        """)),
+})
+
+
+# Quick-load demo descriptions for the sample scenario buttons.
+_SAMPLE_SCENARIOS = types.MappingProxyType({
+    "Healthcare Chatbot": "A chatbot that helps hospital patients schedule appointments and refill prescriptions. It accesses their medical records to check medication history and insurance eligibility. Patients interact directly via web and mobile app. The system suggests appointment times but requires nurse approval for prescription refills.",
+    "Internal Code Copilot": "An internal code completion tool for our engineering team. It suggests code snippets based on our proprietary codebase. Engineers review all suggestions before committing. Only used by employees with existing code access. No customer data involved.",
+    "Automated Trading": "An automated trading system that buys and sells securities based on market signals. It executes trades autonomously up to $50K per trade without human review. Larger trades escalate to compliance. Processes real-time market data and client portfolio information.",
+})
+
+
+def _render_collapsible(label: str, body: str, *, key: str) -> None:
+    """Render ``body`` only while its toggle is on.
+
+    A collapsed ``st.expander`` still ships its contents on every rerun; a toggle
+    keeps long static copy out of the page until someone asks for it.
+    """
+
+    if st.toggle(label, key=key):
+        with st.container(border=True):
+            st.markdown(body)
 
 
 def main():
@@ -182,64 +640,15 @@ def main():
     )
     
     # Framing panel
-    with st.expander("ℹ️ About This Tool — Read This First", expanded=False):
-        st.markdown("""
-        ### What This Is
-        A **demonstration prototype** showing one potential approach to AI risk assessment:
-        - **Triage** AI systems based on impact and context
-        - **Score** risk using transparent, additive factors across 16 dimensions
-        - **Map** scenarios to governance standards (NIST AI RMF, EU AI Act, OWASP, etc.)
-        - **Generate** decision records for stakeholder review
-        
-        ### Risk Level Definitions
-        
-        | Tier | Score Range | Characteristics | Governance Requirements |
-        |------|-------------|-----------------|-------------------------|
-        | 🟢 **Low** | 0-3 | Minimal data, human oversight, reversible decisions | Standard security practices |
-        | 🟡 **Medium** | 4-6 | Some PII/automation, customer-facing | Enhanced monitoring, documentation |
-        | 🟠 **High** | 7-9 | Sensitive data, consequential decisions | Executive review, compliance checks, audit trail |
-        | 🔴 **Critical** | 10+ | Healthcare/Finance + High stakes + Autonomy | Legal review, DPIA, red-team testing, board approval |
-        
-        **Examples:**
-        - **Low:** Internal analytics dashboard (aggregated data only)
-        - **Medium:** Customer support chatbot (suggests responses, human approves)
-        - **High:** Credit approval assistant (recommends decisions with oversight)
-        - **Critical:** Autonomous medical diagnosis system (PHI + life/safety impact)
-        
-        **Scoring:** Risk score is additive based on PII, customer-facing, high-stakes, autonomy level, sector (healthcare/finance/critical infrastructure), and modifiers (bio/cyber/children/disinformation).
-        
-        ### What This Is NOT
-        - ❌ **Not production software** — Intended for educational and demonstrative purposes only
-        - ❌ **Not comprehensive** — A sample implementation, not an enterprise solution
-        - ❌ **Not legal advice** — Always validate with legal, compliance, and security partners
-        - ❌ **Not authoritative** — Framework citations are illustrative examples only
-        
-        ### Assumptions & Limitations
-        **⚠️ All content should be treated as sample/demonstrative use only**
-        
-        - **Scoring weights:** Illustrative, not empirically validated for production use
-        - **Policy packs:** Example YAML files, not official regulatory text
-        - **Framework citations:** Illustrative references, not authoritative legal interpretations
-        - **AI analysis:** Powered by OpenAI API; responses are AI-generated suggestions
-        - **Decision records:** Templates for demonstration, not binding legal documents
-        - **No data storage:** Assessments are session-only and not persisted
-        
-        ### Recommended Use
-        Use this tool to:
-        - Explore governance-as-code concepts
-        - Learn about AI risk frameworks interactively
-        - Generate discussion materials for team conversations
-        - Understand what factors matter for AI governance
-        
-        **Before production deployment:** Engage legal, privacy, security, and compliance teams to validate all requirements.
-        """)
+    _render_collapsible("ℹ️ About This Tool — Read This First", _ABOUT_MD, key="_about_open")
     
     st.caption(
         "Governance-as-code prototype. Defensive use only; validate with legal, privacy, and security partners."
     )
     # Force redeploy marker: v1.0.2
 
-    packs = _load_packs()
+    packs_version = policy_packs_fingerprint(_POLICY_PACKS_DIR)
+    packs = _load_packs(packs_version)
     
     # Get policy validation status
     from common.utils.policy_loader import get_policy_validation_status
@@ -253,6 +662,16 @@ def main():
             value=False,
             help="Use canned responses instead of OpenAI API. Useful for exploring the workflow without an API key."
         )
+        st.toggle(
+            "Queue chat questions for batch processing",
+            key="governance_batch_mode",
+            help="Send non-urgent Q&A questions through the OpenAI Batch API at half the cost. Answers are added to the chat when ready (within 24h).",
+        )
+        st.toggle(
+            "Use gpt-4o for complex drafting",
+            key="governance_draft_upgrade",
+            help="Q&A answers use gpt-4o-mini by default. When on, requests to draft emails, memos or letters use gpt-4o instead.",
+        )
         
         # Policy pack validation status
         if validation_status["ok"] == validation_status["total"]:
@@ -263,51 +682,26 @@ def main():
         
         st.markdown("---")
         st.header("🔒 Data Handling")
-        st.markdown("""
-        **Your data privacy:**
-        - ✅ **No data stored:** Assessments exist only in your browser session (not saved to database)
-        - ✅ **Session-only:** All data cleared when you close the browser tab
-        - ⚠️ **AI analysis:** Your scenario descriptions and answers are sent to OpenAI's API for analysis
-        
-        **What gets sent to OpenAI:**
-        - Your AI use case description
-        - Your answers to clarifying questions
-        - Any additional context you provide for refinement
-        
-        **What stays local:**
-        - Risk score calculations (computed in browser)
-        - Policy pack matching logic
-        - Decision record generation
-        
-        **Important recommendations:**
-        - ❌ Don't paste real PII/PHI or confidential information
-        - ✅ Use anonymized/hypothetical examples instead
-        - ⚠️ For production assessments, deploy locally or consult legal/privacy teams
-        
-        [OpenAI Terms](https://openai.com/policies/terms-of-use) | [Streamlit Privacy](https://streamlit.io/privacy-policy)
-        """)
+        st.markdown(_DATA_HANDLING_MD)
         
         st.markdown("---")
         st.markdown("**📚 More Information**")
-        st.markdown("""
-        This is an open-source demonstration of governance-as-code patterns.
-        
-        [GitHub Repository](https://github.com/hankthevc/rai-toolkit) | [Report Issues](https://github.com/hankthevc/rai-toolkit/issues) | [Documentation](https://github.com/hankthevc/rai-toolkit/tree/main/docs)
-        """)
+        st.markdown(_MORE_INFO_MD)
 
     # Initialize session state for AI-parsed values
-    if "ai_analysis" not in st.session_state:
-        st.session_state.ai_analysis = None
     if "show_ai_preview" not in st.session_state:
         st.session_state.show_ai_preview = False
     if "governance_chat" not in st.session_state:
         st.session_state.governance_chat = []
     if "interview_mode" not in st.session_state:
         st.session_state.interview_mode = False
-    if "interview_history" not in st.session_state:
-        st.session_state.interview_history = []
-    if "interview_questions" not in st.session_state:
-        st.session_state.interview_questions = None
+    if "interview_history" not in st.session_state or "enriched_turns" not in st.session_state:
+        _reset_interview_state()
+
+    # One lookup per run; the dict is shared, so writes through it persist.
+    session_objects = _session_objects()
+    # Resolved once per run and shared by both interview branches below.
+    api_key = _api_key()
 
     # AI Analysis section (outside form for interactivity)
     st.subheader("🤖 AI-Powered Analysis (Experimental)")
@@ -320,75 +714,25 @@ def main():
     """)
     
     # Show prompt tips prominently
-    with st.expander("💡 How to Write a Good Prompt — Full Examples & Tips", expanded=False):
-        st.markdown("""
-        **Include these 6 elements for best AI analysis:**
-        
-        1. **What the AI does** — Core functionality and decision-making role
-        2. **Who uses it** — Internal employees, customers, vulnerable populations, general public
-        3. **What data it processes** — Personal info, health records, financial data, behavioral data
-        4. **Level of automation** — Does it suggest, assist, decide with oversight, or act autonomously?
-        5. **Impact domain** — What happens if it makes a mistake? (safety, rights, finances, privacy)
-        6. **Context flags** — Healthcare, finance, children, cybersecurity, bio/life sciences, disinformation
-        
-        ---
-        
-        ### ✅ Example: Healthcare Chatbot (Critical Risk)
-        
-        *"A chatbot that helps hospital patients schedule appointments and refill prescriptions. It accesses their medical records to check medication history and insurance eligibility. Patients interact directly via web and mobile app. The system suggests appointment times but requires nurse approval for prescription refills."*
-        
-        **Why it's good:** Clear functionality (scheduling/prescriptions), users (patients), data (medical records), automation (suggests with nurse approval), impact (healthcare decisions), context (healthcare).
-        
-        ---
-        
-        ### ✅ Example: Code Copilot (Low Risk)
-        
-        *"An internal code completion tool for our engineering team. It suggests code snippets based on our proprietary codebase. Engineers review all suggestions before committing. Only used by employees with existing code access. No customer data involved."*
-        
-        **Why it's good:** Clear functionality (code suggestions), users (internal engineers), data (code, no customer data), automation (suggestion only), impact (low - human review), context (internal tooling).
-        
-        ---
-        
-        ### ✅ Example: Trading System (Critical Risk)
-        
-        *"An automated trading system that buys and sells securities based on market signals. It executes trades autonomously up to $50K per trade without human review. Larger trades escalate to compliance. Processes real-time market data and client portfolio information."*
-        
-        **Why it's good:** Clear functionality (automated trading), users (implicit: clients), data (portfolio + market data), automation (autonomous up to threshold), impact (financial), context (finance).
-        
-        ---
-        
-        ### ❌ Too Vague Examples
-        
-        - **"A chatbot for customers"** → Missing: What does it do? What data? What decisions? What stakes?
-        - **"AI for hiring"** → Missing: Resume screening? Interview scheduling? Autonomous rejection? What data does it see?
-        - **"Machine learning model"** → Missing: Everything! What's the use case?
-        
-        ---
-        
-        **The AI will analyze your description and suggest risk modifiers. You'll review its reasoning before accepting.**
-        """)
+    _render_collapsible(
+        "💡 How to Write a Good Prompt — Full Examples & Tips", _PROMPT_TIPS_MD, key="_prompt_tips_open"
+    )
     
     # Sample scenario quick-load buttons
     st.markdown("**⚡ Quick Demo:** Load a sample scenario to see how it works")
     col1, col2, col3 = st.columns(3)
     
-    sample_scenarios = {
-        "Healthcare Chatbot": "A chatbot that helps hospital patients schedule appointments and refill prescriptions. It accesses their medical records to check medication history and insurance eligibility. Patients interact directly via web and mobile app. The system suggests appointment times but requires nurse approval for prescription refills.",
-        "Internal Code Copilot": "An internal code completion tool for our engineering team. It suggests code snippets based on our proprietary codebase. Engineers review all suggestions before committing. Only used by employees with existing code access. No customer data involved.",
-        "Automated Trading": "An automated trading system that buys and sells securities based on market signals. It executes trades autonomously up to $50K per trade without human review. Larger trades escalate to compliance. Processes real-time market data and client portfolio information."
-    }
-    
     with col1:
         if st.button("🏥 Healthcare Chatbot", use_container_width=True):
-            st.session_state.quick_desc = sample_scenarios["Healthcare Chatbot"]
+            st.session_state.quick_desc = _SAMPLE_SCENARIOS["Healthcare Chatbot"]
             st.rerun()
     with col2:
         if st.button("💻 Code Copilot", use_container_width=True):
-            st.session_state.quick_desc = sample_scenarios["Internal Code Copilot"]
+            st.session_state.quick_desc = _SAMPLE_SCENARIOS["Internal Code Copilot"]
             st.rerun()
     with col3:
         if st.button("📈 Trading System", use_container_width=True):
-            st.session_state.quick_desc = sample_scenarios["Automated Trading"]
+            st.session_state.quick_desc = _SAMPLE_SCENARIOS["Automated Trading"]
             st.rerun()
     
     # Initialize session state for text area if not exists
@@ -416,54 +760,47 @@ def main():
         
         with st.spinner("Analyzing your description and preparing questions..."):
             try:
-                # Get API key from Streamlit Cloud secrets
-                api_key = None
-                try:
-                    api_key = st.secrets.get("OPENAI_API_KEY")
-                except Exception as e:
-                    st.error(f"⚠️ Error getting API key: {str(e)}")
-                
                 if api_key:
-                    # Conduct initial interview
-                    interview_response = conduct_interview(
-                        initial_description=quick_description,
-                        conversation_history=st.session_state.interview_history,
-                        api_key=api_key,
-                        demo_mode=demo_mode
+                    # Questions appear here as they stream in, then move into the form
+                    streamed_questions = st.container()
+                    # Conduct initial interview (answered rounds also return the analysis)
+                    interview_response, analysis = _run_interview_turn(
+                        quick_description,
+                        api_key,
+                        demo_mode,
+                        on_question=lambda q: streamed_questions.markdown(f"❓ {q.question}"),
                     )
                     if interview_response:
                         if interview_response.ready_for_analysis:
                             # Enough context gathered, proceed to analysis
                             st.success("✅ Sufficient context gathered! Proceeding with comprehensive analysis...")
-                            # Build enriched description from conversation
-                            enriched_description = quick_description + "\n\n**Additional Context from Interview:**\n"
-                            for turn in st.session_state.interview_history:
-                                enriched_description += f"Q: {turn['question']}\nA: {turn['answer']}\n\n"
-                            
-                            analysis = parse_scenario_with_ai(enriched_description, api_key=api_key, demo_mode=demo_mode)
                             if analysis:
-                                st.session_state.ai_analysis = analysis
+                                session_objects["ai_analysis"] = analysis
                                 st.session_state.show_ai_preview = True
                                 st.session_state.interview_mode = False
-                                st.session_state.interview_history = []  # Reset for next time
+                                _reset_interview_state()  # Reset for next time
                         else:
                             # Need more info - show questions
                             st.session_state.interview_mode = True
-                            st.session_state.interview_questions = interview_response
+                            session_objects["interview_questions"] = interview_response
                             st.rerun()
+                else:
+                    st.error("⚠️ OpenAI API key not configured. Add OPENAI_API_KEY to Streamlit secrets.")
             except ImportError as e:
                 st.error(f"⚠️ OpenAI package not installed: {str(e)}")
             except Exception as e:
                 st.error(f"❌ Analysis error: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
+                # Tracebacks expose server paths, so only show them when debugging
+                if os.getenv("RAI_TOOLKIT_DEBUG"):
+                    import traceback
+                    st.code(traceback.format_exc())
     
     # Display interview questions if in interview mode
-    if st.session_state.interview_mode and st.session_state.interview_questions:
+    if st.session_state.interview_mode and session_objects["interview_questions"]:
         st.markdown("---")
         st.subheader("🔍 Clarifying Questions for Comprehensive Assessment")
         
-        response = st.session_state.interview_questions
+        response = session_objects["interview_questions"]
         st.info(response.reasoning)
         
         st.markdown(f"**Please answer these {len(response.questions)} questions to ensure accurate risk assessment:**")
@@ -488,141 +825,53 @@ def main():
         if submit_answers:
             # Check all answers provided
             if all(a["answer"].strip() for a in answers):
-                # Add to history
-                st.session_state.interview_history.extend(answers)
-                
-                # Get API key from Streamlit Cloud secrets
-                api_key = None
-                try:
-                    api_key = st.secrets.get("OPENAI_API_KEY")
-                except:
-                    pass
-                
                 # Continue interview or proceed to analysis
                 with st.spinner("Processing your answers..."):
-                    interview_response = conduct_interview(
-                        initial_description=quick_description,
-                        conversation_history=st.session_state.interview_history,
-                        api_key=api_key,
-                        demo_mode=demo_mode
-                    )
-                    
-                    if interview_response and interview_response.ready_for_analysis:
-                        # Ready for final analysis
-                        enriched_description = quick_description + "\n\n**Additional Context from Interview:**\n"
-                        for turn in st.session_state.interview_history:
-                            enriched_description += f"Q: {turn['question']}\nA: {turn['answer']}\n\n"
-                        
-                        analysis = parse_scenario_with_ai(enriched_description, api_key=api_key, demo_mode=demo_mode)
-                        if analysis:
-                            st.session_state.ai_analysis = analysis
-                            st.session_state.show_ai_preview = True
-                            st.session_state.interview_mode = False
-                            st.session_state.interview_questions = None
-                            st.success("✅ Comprehensive analysis complete based on interview!")
-                            st.rerun()
+                    try:
+                        # Interview decision and final analysis come back from one request
+                        interview_response, analysis = _run_interview_turn(
+                            quick_description,
+                            api_key,
+                            demo_mode,
+                            answers=answers,
+                        )
+                    except Exception as e:
+                        # Nothing was recorded, so resubmitting sends the same history
+                        st.error(f"❌ Analysis error: {str(e)}")
                     else:
-                        # More questions needed
-                        st.session_state.interview_questions = interview_response
-                        st.rerun()
+                        if interview_response and interview_response.ready_for_analysis:
+                            # Ready for final analysis
+                            if analysis:
+                                _record_interview_answers(answers)
+                                session_objects["ai_analysis"] = analysis
+                                st.session_state.show_ai_preview = True
+                                st.session_state.interview_mode = False
+                                session_objects["interview_questions"] = None
+                                st.success("✅ Comprehensive analysis complete based on interview!")
+                                st.rerun()
+                        else:
+                            # More questions needed; this round's answers join the history
+                            _record_interview_answers(answers)
+                            session_objects["interview_questions"] = interview_response
+                            st.rerun()
             else:
                 st.warning("⚠️ Please answer all questions to continue the assessment.")
 
     # Display AI analysis preview
-    if st.session_state.show_ai_preview and st.session_state.ai_analysis:
+    analysis = session_objects["ai_analysis"]
+    if st.session_state.show_ai_preview and analysis:
         # Show AI's full analytical reasoning
         st.success("✅ AI Analysis Complete")
         
-        analysis = st.session_state.ai_analysis
-        
         # Defensive check for backward compatibility with old session state
         if not hasattr(analysis, 'estimated_risk_tier'):
             st.warning("⚠️ Analysis format outdated. Clearing cache and refreshing...")
             st.session_state.show_ai_preview = False
-            st.session_state.ai_analysis = None
+            session_objects["ai_analysis"] = None
             st.info("Please click the 'Analyze with AI' button again to re-run the analysis with the updated format.")
             # Don't continue executing this section
         else:
-            # Show AI's risk assessment as Step 1
-            risk_tier_colors = {
-                "Low": "🟢",
-                "Medium": "🟡", 
-                "High": "🟠",
-                "Critical": "🔴"
-            }
-            risk_icon = risk_tier_colors.get(analysis.estimated_risk_tier, "⚪")
-            
-            # Scroll to top to show the completed assessment
-            st.markdown('<script>window.scrollTo(0, 0);</script>', unsafe_allow_html=True)
-            
-            st.markdown("### 📊 Two-Step Risk Assessment")
-            st.markdown("---")
-            
-            # Step 1: AI Initial Screening
-            st.markdown(f"#### Step 1: AI Initial Screening")
-            st.markdown(f"### {risk_icon} Preliminary Assessment: **{analysis.estimated_risk_tier} Risk**")
-            st.caption("*Based on AI analysis of scenario description*")
-            
-            # Show what changed if this is a refinement
-            if "refinement_comparison" in st.session_state:
-                comparison = st.session_state.refinement_comparison
-                
-                with st.container():
-                    st.markdown("---")
-                    st.markdown("#### 🔄 Analysis Updated with Additional Context")
-                    
-                    # Show resolved gaps
-                    if comparison["resolved_gaps"]:
-                        st.markdown("**✅ Gaps Addressed:**")
-                        for gap in comparison["resolved_gaps"]:
-                            st.markdown(f"- ~~{gap}~~")
-                    
-                    # Show tier change if applicable
-                    if comparison["tier_changed"]:
-                        tier_colors = {"Low": "🟢", "Medium": "🟡", "High": "🟠", "Critical": "🔴"}
-                        original_icon = tier_colors.get(comparison["original_tier"], "⚪")
-                        new_icon = tier_colors.get(comparison["new_tier"], "⚪")
-                        
-                        st.markdown(f"**📊 Risk Assessment Updated:**")
-                        st.markdown(f"{original_icon} {comparison['original_tier']} → {new_icon} **{comparison['new_tier']}**")
-                        st.caption("*The new information affected the risk calculus - see updated reasoning below*")
-                    else:
-                        st.markdown(f"**📊 Risk Tier:** {analysis.estimated_risk_tier} (unchanged)")
-                        if comparison["resolved_gaps"]:
-                            st.caption("*Risk tier remains the same, but gaps were resolved with additional context*")
-                    
-                    st.markdown("---")
-                
-                # Clear the comparison after showing it once
-                # (Actually don't clear - keep it so it shows on the page)
-            
-            # Show reasoning
-            with st.expander("📋 View AI Analysis Details", expanded=True):
-                st.markdown(f"**Why this preliminary assessment:**\n\n{analysis.reasoning}")
-                
-                st.markdown("---")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**🎯 Key Risk Factors:**")
-                    for factor in analysis.key_risk_factors:
-                        st.markdown(f"- {factor}")
-                
-                with col2:
-                    st.markdown("**📚 Framework Alignment:**")
-                    st.markdown(analysis.framework_alignment)
-            
-            # Show recommended safeguards
-            with st.expander("🛡️ AI-Recommended Safeguards", expanded=True):
-                st.markdown("Based on the scenario analysis, these governance controls should apply:")
-                for i, safeguard in enumerate(analysis.recommended_safeguards, 1):
-                    st.markdown(f"{i}. {safeguard}")
-                st.caption("*Note: The traditional risk engine below will also apply safeguards based on policy packs. Compare both sets of recommendations.*")
-            
-            # Automatically trigger risk assessment from AI analysis
-            st.markdown("---")
-            _render_risk_assessment_from_ai(st.session_state.ai_analysis, quick_description, packs, demo_mode)
+            _render_ai_preview(quick_description, packs, packs_version, demo_mode)
             return
 
     # If no AI analysis yet, show info message
@@ -631,109 +880,157 @@ def main():
     _render_about_section()
 
 
-def _render_risk_assessment_from_ai(ai_analysis, use_case: str, packs, demo_mode: bool = False):
+def _ai_preview_strings(analysis) -> dict:
+    """Build the Step 1 preview copy that depends only on the analysis."""
+
+    risk_icon = _RISK_TIER_ICONS.get(analysis.estimated_risk_tier, "⚪")
+    return {
+        "header": (
+            "### 📊 Two-Step Risk Assessment\n\n---\n\n"
+            "#### Step 1: AI Initial Screening\n\n"
+            f"### {risk_icon} Preliminary Assessment: **{analysis.estimated_risk_tier} Risk**"
+        ),
+        "reasoning": f"**Why this preliminary assessment:**\n\n{analysis.reasoning}\n\n---",
+        "risk_factors": "**🎯 Key Risk Factors:**\n\n" + _markdown_list(tuple(analysis.key_risk_factors)),
+        "frameworks": f"**📚 Framework Alignment:**\n\n{analysis.framework_alignment}",
+        "safeguards": (
+            "Based on the scenario analysis, these governance controls should apply:\n\n"
+            + _markdown_list(tuple(analysis.recommended_safeguards), numbered=True)
+        ),
+    }
+
+
+@st.fragment
+def _render_ai_preview(use_case: str, packs, packs_version: str, demo_mode: bool) -> None:
+    """Render the AI preview and formal assessment without rerunning the input form."""
+
+    # Read from session state so fragment reruns pick up refined analyses.
+    session_objects = _session_objects()
+    analysis = session_objects["ai_analysis"]
+
+    # Derived copy is built once per analysis object and reused on later reruns
+    cached = session_objects.get("ai_preview")
+    if cached and cached[0] is analysis:
+        preview = cached[1]
+    else:
+        preview = _ai_preview_strings(analysis)
+        session_objects["ai_preview"] = (analysis, preview)
+
+    # Scroll to top to show the completed assessment
+    st.markdown('<script>window.scrollTo(0, 0);</script>', unsafe_allow_html=True)
+
+    # Static copy is batched into one st.markdown per section to cut frontend deltas.
+    # Step 1: AI Initial Screening
+    st.markdown(preview["header"])
+    st.caption("*Based on AI analysis of scenario description*")
+
+    # Show what changed if this is a refinement
+    if "refinement_comparison" in st.session_state:
+        comparison = st.session_state.refinement_comparison
+
+        with st.container():
+            sections = ["---", "#### 🔄 Analysis Updated with Additional Context"]
+
+            # Show resolved gaps
+            if comparison["resolved_gaps"]:
+                sections.append("**✅ Gaps Addressed:**\n" + "\n".join(f"- ~~{gap}~~" for gap in comparison["resolved_gaps"]))
+
+            # Show tier change if applicable
+            if comparison["tier_changed"]:
+                original_icon = _RISK_TIER_ICONS.get(comparison["original_tier"], "⚪")
+                new_icon = _RISK_TIER_ICONS.get(comparison["new_tier"], "⚪")
+
+                sections.append("**📊 Risk Assessment Updated:**")
+                sections.append(f"{original_icon} {comparison['original_tier']} → {new_icon} **{comparison['new_tier']}**")
+                st.markdown("\n\n".join(sections))
+                st.caption("*The new information affected the risk calculus - see updated reasoning below*")
+            else:
+                sections.append(f"**📊 Risk Tier:** {analysis.estimated_risk_tier} (unchanged)")
+                st.markdown("\n\n".join(sections))
+                if comparison["resolved_gaps"]:
+                    st.caption("*Risk tier remains the same, but gaps were resolved with additional context*")
+
+            st.markdown("---")
+
+        # Clear the comparison after showing it once
+        # (Actually don't clear - keep it so it shows on the page)
+
+    # Show reasoning
+    with st.expander("📋 View AI Analysis Details", expanded=True):
+        st.markdown(preview["reasoning"])
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(preview["risk_factors"])
+
+        with col2:
+            st.markdown(preview["frameworks"])
+
+    # Show recommended safeguards
+    with st.expander("🛡️ AI-Recommended Safeguards", expanded=True):
+        st.markdown(preview["safeguards"])
+        st.caption("*Note: The traditional risk engine below will also apply safeguards based on policy packs. Compare both sets of recommendations.*")
+
+    # Automatically trigger risk assessment from AI analysis
+    st.markdown("---")
+    _render_risk_assessment_from_ai(analysis, use_case, packs, packs_version, demo_mode)
+
+
+def _render_risk_assessment_from_ai(ai_analysis, use_case: str, packs, packs_version: str, demo_mode: bool = False):
     """Automatically generate risk assessment from AI analysis results."""
     
-    # Convert AI analysis to RiskInputs
-    risk_inputs = RiskInputs(
-        contains_pii=ai_analysis.contains_pii,
-        customer_facing=ai_analysis.customer_facing,
-        high_stakes=ai_analysis.high_stakes,
-        autonomy_level=ai_analysis.autonomy_level,
-        sector=ai_analysis.sector,
-        modifiers=list(ai_analysis.modifiers),
-        model_type=ai_analysis.model_type,
-        data_source=ai_analysis.data_source,
-        learns_in_production=ai_analysis.learns_in_production,
-        international_data=ai_analysis.international_data,
-        explainability_level=ai_analysis.explainability_level,
-        uses_foundation_model=ai_analysis.uses_foundation_model,
-        generates_synthetic_content=ai_analysis.generates_synthetic_content,
-        dual_use_risk=ai_analysis.dual_use_risk,
-        decision_reversible=ai_analysis.decision_reversible,
-        protected_populations=list(ai_analysis.protected_populations),
-    )
-    assessment = calculate_risk_score(risk_inputs)
-    scenario_context = _build_scenario_context(risk_inputs, assessment.tier)
-    
-    controls = select_applicable_controls(packs, scenario_context)
+    # Older analyses may lack some fields; resolve each one once up front.
+    ai_tier = getattr(ai_analysis, 'estimated_risk_tier', None)
+    recommended_safeguards = getattr(ai_analysis, 'recommended_safeguards', None)
+    gaps = getattr(ai_analysis, 'gaps_and_limitations', None)
+
+    # Reruns that keep the same analysis object (chat turns, toggles, downloads)
+    # reuse the scored result and narrative without hashing or rebuilding them.
+    session_objects = _session_objects()
+    cached = session_objects.get("ai_render")
+    if cached and cached[0] is ai_analysis and cached[1] == packs_version:
+        risk_inputs, assessment, scenario_context, controls, narrative_md = cached[2:]
+    else:
+        # Convert AI analysis to RiskInputs; unchanged analyses hit the cache
+        risk_inputs = _risk_inputs_from_analysis(ai_analysis)
+        assessment, scenario_context, controls = _score_and_select(packs_version, risk_inputs, packs)
+        narrative_md = _assessment_narrative_md(ai_analysis, assessment)
+        session_objects["ai_render"] = (
+            ai_analysis, packs_version, risk_inputs, assessment, scenario_context, controls, narrative_md,
+        )
     
     # Step 2: Formal Risk Scoring
-    st.markdown("---")
-    st.markdown(f"#### Step 2: Formal Risk Scoring")
-    
-    # Build comprehensive prose assessment
-    risk_tier_icons = {
-                "Low": "🟢",
-                "Medium": "🟡",
-                "High": "🟠",
-                "Critical": "🔴"
-    }
-    risk_icon = risk_tier_icons.get(assessment.tier, "⚪")
+    risk_icon = _RISK_TIER_ICONS.get(assessment.tier, "⚪")
     
     # Show final classification
-    st.markdown(f"### {risk_icon} Final Classification: **{assessment.tier}** (Score: {assessment.score})")
+    st.markdown(
+        "---\n\n#### Step 2: Formal Risk Scoring\n\n"
+        f"### {risk_icon} Final Classification: **{assessment.tier}** (Score: {assessment.score})"
+    )
     st.caption("*Based on weighted scoring across 16 risk factors — use this for governance decisions*")
     
-    # Build narrative assessment combining AI and traditional analysis
-    assessment_narrative = []
-    
-    # Note if AI and scored classification differ
-    if hasattr(ai_analysis, 'estimated_risk_tier') and ai_analysis.estimated_risk_tier != assessment.tier:
-        assessment_narrative.append(f"⚠️ **Variance Detected:** Initial AI screening suggested **{ai_analysis.estimated_risk_tier}** tier, but formal scoring yielded **{assessment.tier}** (score: {assessment.score} from {len(assessment.contributing_factors)} weighted factors).")
-        assessment_narrative.append(f"\n*This variance may indicate nuances worth reviewing with legal/compliance teams before finalizing the risk classification.*")
-    
-    # Contributing factors
-    if assessment.contributing_factors:
-        factors_text = ", ".join(assessment.contributing_factors)
-        assessment_narrative.append(f"\n**Key Risk Drivers:** {factors_text}")
-    
-    # Framework alignment (from AI if available)
-    if hasattr(ai_analysis, 'framework_alignment'):
-        assessment_narrative.append(f"\n**Regulatory Frameworks Implicated:** {ai_analysis.framework_alignment}")
-    
-    # Key risk factors (from AI if available)
-    if hasattr(ai_analysis, 'key_risk_factors') and ai_analysis.key_risk_factors:
-        risks_bullets = "\n".join([f"- {risk}" for risk in ai_analysis.key_risk_factors])
-        assessment_narrative.append(f"\n**Specific Risks Identified:**\n{risks_bullets}")
-    
-    # Render the full narrative
-    st.markdown("\n\n".join(assessment_narrative))
-    
-    # Recommended safeguards section
-    if hasattr(ai_analysis, 'recommended_safeguards') and ai_analysis.recommended_safeguards:
-        st.markdown("\n**Recommended Governance Controls:**")
-        for i, safeguard in enumerate(ai_analysis.recommended_safeguards, 1):
-            st.markdown(f"{i}. {safeguard}")
+    # Render the full narrative, with recommended safeguards in the same block
+    if recommended_safeguards:
+        st.markdown(
+            f"{narrative_md}\n\n**Recommended Governance Controls:**\n\n"
+            + _markdown_list(tuple(recommended_safeguards), numbered=True)
+        )
         st.caption("*These recommendations are derived from AI analysis of the scenario against established governance frameworks. Review the policy pack controls below for formal requirements.*")
+    else:
+        st.markdown(narrative_md)
     
     # Standards tags
-    st.markdown("---")
-    st.markdown("**📚 Governance Standards Applied:**")
+    standards_header = "---\n\n**📚 Governance Standards Applied:**"
     
-    # Collect unique authorities from triggered controls
-    authorities = set()
-    for control in controls:
-        authorities.add(control.authority)
+    # Collect unique authorities from triggered controls in a single pass
+    authorities = frozenset(control.authority for control in controls)
     
     # Display as badges/tags
     if authorities:
-        # Create color-coded badges for different standards
-        standard_colors = {
-            "NIST AI RMF": "#0066cc",
-            "EU AI Act": "#003399",
-            "ISO/IEC 42001": "#006600",
-            "OWASP LLM Top 10": "#cc0000",
-            "MITRE ATLAS": "#990000",
-            "US OMB M-24-10": "#4d4d4d"
-        }
-        
-        badge_html = " ".join([
-            f'<span style="background-color: {standard_colors.get(auth, "#666666")}; color: white; padding: 4px 12px; border-radius: 12px; margin: 4px; display: inline-block; font-size: 0.85em;">{auth}</span>'
-            for auth in sorted(authorities)
-        ])
-        st.markdown(badge_html, unsafe_allow_html=True)
+        st.markdown(f"{standards_header}\n\n{_badges_html(authorities)}", unsafe_allow_html=True)
     else:
+        st.markdown(standards_header)
         st.caption("No specific standards triggered for this risk profile.")
 
     # Safeguards surface authority + clause so reviewers can trace each recommendation.
@@ -741,354 +1038,510 @@ def _render_risk_assessment_from_ai(ai_analysis, use_case: str, packs, demo_mode
     st.subheader("Required Safeguards from Policy Packs")
     st.caption("These safeguards are triggered by the traditional risk engine based on YAML policy packs.")
     if controls:
-        for control in controls:
-            with st.expander(f"{control.title} — {control.authority}", expanded=False):
-                st.markdown(
-                    "\n".join(
-                        [
-                            f"**ID:** {control.id}",
-                            f"**Clause:** {control.clause}",
-                            f"**Description:** {control.description}",
-                            f"**Evidence:** {control.evidence}",
-                            f"**Tags:** {', '.join(control.tags) if control.tags else 'None'}",
-                        ]
-                    )
-                )
-                if control.mappings:
-                    mapping_lines: List[str] = []
-                    for key, values in control.mappings.items():
-                        mapping_lines.append(f"{key}: {', '.join(values)}")
-                    st.markdown(f"**Mappings:** {', '.join(mapping_lines)}")
+        _render_safeguards(controls, packs_version)
     else:
         st.warning(
             "No safeguards matched the scenario inputs. Review policy coverage before approving.",
             icon="⚠️",
         )
 
-    # Extract metadata from AI analysis
-    unknowns = []
-    model_name = "demo-mode" if demo_mode else "gpt-4o"
-    model_temp = 0.3
-    if hasattr(ai_analysis, 'gaps_and_limitations'):
-        unknowns = ai_analysis.gaps_and_limitations
-    
-    # Provide download for decision record (without requiring owner/approver since AI-driven)
-    record = build_decision_record(
-        scenario=scenario_context,
-        assessment=assessment,
-        controls=controls,
-        owner="AI-Driven Assessment",
-        approver="Pending Review",
-        risk_inputs=risk_inputs,
-        model_name=model_name,
-        model_temperature=model_temp,
-        unknowns=unknowns,
-    )
-    
-    # Generate Transparency Note (illustrative template)
-    transparency_note = build_transparency_note(
-        scenario=scenario_context,
-        assessment=assessment,
-        controls=controls,
-        model_name=model_name,
-        model_temperature=model_temp,
-    )
-    
-    # Download buttons in columns
-    col_dr, col_tn = st.columns(2)
-    with col_dr:
-        st.download_button(
-            label="📄 Download Decision Record",
-            data=record,
-            file_name="frontier_ai_decision_record.md",
-            mime="text/markdown",
-            use_container_width=True,
-            help="Complete risk assessment with safeguards and approval signatures"
-        )
-    with col_tn:
-        st.download_button(
-            label="📋 Download Transparency Note (stub)",
-            data=transparency_note,
-            file_name="transparency_note_stub.md",
-            mime="text/markdown",
-            use_container_width=True,
-            help="Illustrative template: Stakeholder communication (requires completion)"
-        )
-    
+    _render_exports(use_case, risk_inputs, scenario_context, assessment, controls, ai_analysis, demo_mode)
+
     # Owners & Next Steps
-        st.markdown("---")
+    st.markdown("---")
     st.subheader("👥 Owners & Next Steps")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**📝 Recommended Owners:**")
-        if assessment.tier in ["Critical", "High"]:
-            st.markdown("""
-            - **Product Lead:** Accountable for roadmap delays
-            - **Legal/Privacy:** Sign off on compliance gaps
-            - **Security:** Approve threat model
-            - **Exec Sponsor:** Final go/no-go decision
-            """)
-        elif assessment.tier == "Medium":
-            st.markdown("""
-            - **Product Lead:** Owns risk acceptance
-            - **Legal or Privacy:** Review data handling
-            - **Engineering Lead:** Validate technical controls
-            """)
-        else:  # Low
-            st.markdown("""
-            - **Product Lead:** Document decision
-            - **Engineering Lead:** Standard review process
-            """)
+        st.markdown(_TIER_OWNERS_MD.get(assessment.tier, _TIER_OWNERS_MD["Low"]))
     
     with col2:
         st.markdown("**⚡ Immediate Next Steps:**")
-        if assessment.tier == "Critical":
-            st.error("""
-            🚨 **STOP-SHIP TIER**
-            1. Escalate to exec leadership immediately
-            2. Engage legal, privacy, and security teams
-            3. Conduct formal risk assessment (this is preliminary)
-            4. Do not deploy until all Critical-tier safeguards are in place
-            """)
-        elif assessment.tier == "High":
-            st.warning("""
-            ⚠️ **High-Risk - Formal Review Required**
-            1. Schedule legal/compliance review
-            2. Document all safeguards in design doc
-            3. Implement monitoring and audit logging
-            4. Plan for external audit if customer-facing
-            """)
-        elif assessment.tier == "Medium":
-            st.info("""
-            ℹ️ **Medium Risk - Standard Process**
-            1. Review recommended safeguards
-            2. Add governance controls to backlog
-            3. Update privacy/security design docs
-            4. Proceed with normal launch process
-            """)
-        else:  # Low
-            st.success("""
-            ✅ **Low Risk - Proceed with Awareness**
-            1. Document this assessment
-            2. Implement basic safeguards
-            3. Monitor for scope changes
-            4. Standard launch process applies
-            """)
+        alert, next_steps = _TIER_NEXT_STEPS.get(assessment.tier, _TIER_NEXT_STEPS["Low"])
+        alert(next_steps)
     
     # Interactive Governance Q&A (NEW)
-    if hasattr(ai_analysis, 'estimated_risk_tier'):
-        st.markdown("---")
-        st.subheader("💬 Ask Questions About This Assessment")
-        st.caption("Get instant answers about safeguards, frameworks, implementation steps, or draft stakeholder communications")
-        
-        # Initialize chat history
-        if "governance_chat" not in st.session_state:
-            st.session_state.governance_chat = []
-        
-        # Suggested questions
-        col1, col2, col3 = st.columns(3)
+    if ai_tier is not None:
+        _render_governance_chat(use_case, assessment, controls, ai_analysis)
+
+    # Gaps & Limitations with Re-Analysis Option (NEW)
+    if gaps:
+        _render_gap_refinement(use_case, ai_analysis, demo_mode)
+
+    st.markdown("---")
+    _render_about_section()
+
+
+def _assessment_narrative_md(ai_analysis, assessment) -> str:
+    """Compose the prose that reconciles the AI screening with the formal score."""
+
+    ai_tier = getattr(ai_analysis, 'estimated_risk_tier', None)
+    framework_alignment = getattr(ai_analysis, 'framework_alignment', None)
+    key_risk_factors = getattr(ai_analysis, 'key_risk_factors', None)
+
+    # Build narrative assessment combining AI and traditional analysis
+    assessment_narrative = []
+    
+    # Note if AI and scored classification differ
+    if ai_tier is not None and ai_tier != assessment.tier:
+        assessment_narrative.append(f"⚠️ **Variance Detected:** Initial AI screening suggested **{ai_tier}** tier, but formal scoring yielded **{assessment.tier}** (score: {assessment.score} from {len(assessment.contributing_factors)} weighted factors).")
+        assessment_narrative.append(f"\n*This variance may indicate nuances worth reviewing with legal/compliance teams before finalizing the risk classification.*")
+    
+    # Contributing factors
+    if assessment.contributing_factors:
+        factors_text = ", ".join(assessment.contributing_factors)
+        assessment_narrative.append(f"\n**Key Risk Drivers:** {factors_text}")
+    
+    # Framework alignment (from AI if available)
+    if framework_alignment is not None:
+        assessment_narrative.append(f"\n**Regulatory Frameworks Implicated:** {framework_alignment}")
+    
+    # Key risk factors (from AI if available)
+    if key_risk_factors:
+        risks_bullets = _markdown_list(tuple(key_risk_factors))
+        assessment_narrative.append(f"\n**Specific Risks Identified:**\n{risks_bullets}")
+
+    return "\n\n".join(assessment_narrative)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _controls_table(packs_version: str, control_ids: tuple, _controls) -> list:
+    """Rows for the safeguards table, built once per pack fingerprint and control set."""
+
+    return [
+        {
+            "ID": control.id,
+            "Safeguard": control.title,
+            "Authority": control.authority,
+            "Clause": control.clause,
+            "Description": control.description,
+            "Evidence": control.evidence,
+            "Tags": control.tags_text,
+            "Mappings": control.mappings_text,
+        }
+        for control in _controls
+    ]
+
+
+def _render_safeguards(controls, packs_version: str) -> None:
+    """List triggered controls as one table rather than a widget per control."""
+
+    st.dataframe(
+        _controls_table(packs_version, tuple(control.id for control in controls), controls),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+@st.fragment
+def _render_exports(
+    use_case: str,
+    risk_inputs: RiskInputs,
+    scenario_context,
+    assessment,
+    controls,
+    ai_analysis,
+    demo_mode: bool,
+) -> None:
+    """Render downloads and the rationale bundle; clicks here rerun only this block."""
+
+    # Documents are only rendered once someone asks for them
+    if not st.session_state.get("exports_requested"):
+        if st.button("📦 Prepare Decision Record & Transparency Note", use_container_width=True):
+            st.session_state.exports_requested = True
+    if st.session_state.get("exports_requested"):
+        model_name = "demo-mode" if demo_mode else "gpt-4o"
+
+        # The render cache keeps the same assessment object across reruns, so its
+        # encoded payloads can be handed back until the documents' dates go stale.
+        today = date.today()
+        session_objects = _session_objects()
+        cached = session_objects.get("export_payloads")
+        if cached and cached[0] is assessment and cached[1] == model_name and cached[2] == today:
+            record, transparency_note = cached[3:]
+        else:
+            from common.utils.exporters import build_decision_record
+            from common.utils.exporters_transparency_note import build_transparency_note
+
+            # Extract metadata from AI analysis
+            unknowns = getattr(ai_analysis, 'gaps_and_limitations', [])
+            model_temp = 0.3
+
+            # Provide download for decision record (without requiring owner/approver since AI-driven)
+            record = build_decision_record(
+                scenario=scenario_context,
+                assessment=assessment,
+                controls=controls,
+                owner="AI-Driven Assessment",
+                approver="Pending Review",
+                risk_inputs=risk_inputs,
+                model_name=model_name,
+                model_temperature=model_temp,
+                unknowns=list(unknowns),
+            )
+
+            # Generate Transparency Note (illustrative template)
+            transparency_note = build_transparency_note(
+                scenario=scenario_context,
+                assessment=assessment,
+                controls=controls,
+                model_name=model_name,
+                model_temperature=model_temp,
+            )
+
+            record, transparency_note = record.encode("utf-8"), transparency_note.encode("utf-8")
+            session_objects["export_payloads"] = (assessment, model_name, today, record, transparency_note)
+
+        # Download buttons in columns
+        col_dr, col_tn = st.columns(2)
+        with col_dr:
+            st.download_button(
+                label="📄 Download Decision Record",
+                data=record,
+                file_name="frontier_ai_decision_record.md",
+                mime="text/markdown",
+                use_container_width=True,
+                help="Complete risk assessment with safeguards and approval signatures"
+            )
+        with col_tn:
+            st.download_button(
+                label="📋 Download Transparency Note (stub)",
+                data=transparency_note,
+                file_name="transparency_note_stub.md",
+                mime="text/markdown",
+                use_container_width=True,
+                help="Illustrative template: Stakeholder communication (requires completion)"
+            )
+
+    # Safeguard rationales are not needed interactively, so they go through the
+    # Batch API at half the per-token cost and are collected when ready.
+    if controls:
+        api_key = _api_key()
+
+        if st.button(
+            "🧾 Generate Export Bundle (safeguard rationales via Batch API)",
+            use_container_width=True,
+            help="Queues one rationale per top safeguard; results arrive within 24h at reduced cost",
+        ):
+            queued = _queue_safeguard_rationales(use_case, assessment, controls, ai_analysis, api_key, demo_mode)
+            if queued["success"]:
+                st.session_state.rationale_batch_id = queued["batch_id"]
+                st.session_state.rationale_batch_results = None
+                st.session_state.rationale_batch_error = None
+            else:
+                st.error(f"⚠️ {queued['error']}")
+
+        _render_rationale_batch_status(controls, api_key)
+
+
+@st.fragment
+def _render_gap_refinement(use_case: str, ai_analysis, demo_mode: bool) -> None:
+    """Render assessment gaps and the optional re-analysis box as one fragment."""
+
+    st.markdown("---")
+    st.subheader("🔬 Assessment Gaps & Additional Context")
+
+    st.info("**This is a demonstration assessment based on limited information.** The following areas couldn't be fully evaluated:")
+
+    st.markdown(_markdown_list(tuple(ai_analysis.gaps_and_limitations), numbered=True))
+
+    st.markdown("**💡 Want a more comprehensive assessment?**")
+    st.caption("If you have additional details about the items above, provide them below to refine the analysis.")
+
+    # Initialize session state for additional context
+    if "show_refinement_box" not in st.session_state:
+        st.session_state.show_refinement_box = False
+
+    if not st.session_state.show_refinement_box:
+        if st.button("📝 Provide Additional Details", use_container_width=True):
+            st.session_state.show_refinement_box = True
+            st.rerun()
+    else:
+        additional_context = st.text_area(
+            "Additional Details:",
+            placeholder="Example: 'Data is stored in AWS us-east-1. We have a BAA with AWS. Human clinicians review all medication suggestions before approval...'",
+            height=120,
+            key="additional_context_input"
+        )
+
+        col1, col2 = st.columns([1, 1])
         with col1:
-            if st.button("❓ Why this risk tier?", use_container_width=True):
-                st.session_state.pending_question = f"Why did this assessment result in {assessment.tier} tier? Explain the specific factors."
+            if st.button(
+                "🔄 Re-Analyze with Additional Context",
+                use_container_width=True,
+                type="primary",
+            ):
+                if additional_context and additional_context.strip():
+                    # Store original analysis for comparison
+                    original_gaps = ai_analysis.gaps_and_limitations.copy()
+                    original_tier = ai_analysis.estimated_risk_tier
+
+                    # Build enriched prompt with gap context
+                    gaps_context = "\n\n**Previous Assessment Gaps:**\n" + _markdown_list(tuple(ai_analysis.gaps_and_limitations))
+                    enriched_description = (
+                        use_case + 
+                        gaps_context + 
+                        "\n\n**Additional Context to Address Gaps:**\n" + additional_context
+                    )
+
+                    # Re-run analysis with enriched context (bypass interview, go straight to analysis)
+                    with st.spinner("Re-analyzing with additional context..."):
+                        try:
+                            api_key = _api_key()
+
+                            if api_key:
+                                from common.utils.ai_parser import parse_scenario_with_ai_cached
+
+                                # Repeated clicks with the same context reuse the cached result
+                                refined_analysis = parse_scenario_with_ai_cached(
+                                    enriched_description, api_key=api_key, demo_mode=demo_mode
+                                )
+                                if refined_analysis:
+                                    # Compare and store what changed
+                                    resolved_gaps = [gap for gap in original_gaps if gap not in refined_analysis.gaps_and_limitations]
+                                    tier_changed = original_tier != refined_analysis.estimated_risk_tier
+
+                                    comparison = {
+                                        "resolved_gaps": resolved_gaps,
+                                        "original_tier": original_tier,
+                                        "new_tier": refined_analysis.estimated_risk_tier,
+                                        "tier_changed": tier_changed,
+                                        "additional_context": additional_context
+                                    }
+
+                                    # Update session state and re-render
+                                    _session_objects()["ai_analysis"] = refined_analysis
+                                    st.session_state.refinement_comparison = comparison
+                                    st.session_state.show_refinement_box = False
+                                    st.rerun()
+                            else:
+                                st.error("⚠️ OpenAI API key not configured.")
+                        except Exception as e:
+                            st.error(f"❌ Re-analysis failed: {str(e)}")
+                else:
+                    st.warning("⚠️ Please provide additional details to re-analyze.")
         with col2:
-            if st.button("📋 Explain safeguards", use_container_width=True):
-                st.session_state.pending_question = "Explain the most critical safeguards and why they're required for this scenario."
-        with col3:
-            if st.button("✉️ Draft email to legal", use_container_width=True):
-                st.session_state.pending_question = "Draft a concise email to our legal team explaining why we need their review before launch."
-        
-        # Display chat history
-        for msg in st.session_state.governance_chat:
-            with st.chat_message(msg["role"]):
-                st.markdown(msg["content"])
-        
-        # Handle pending question from button clicks
-        if "pending_question" in st.session_state:
-            question = st.session_state.pending_question
-            del st.session_state.pending_question
-            
-            # Process the question
-            st.session_state.governance_chat.append({"role": "user", "content": question})
-            
-            # Get AI response
-            with st.spinner("Thinking..."):
-                try:
-                    # Get API key from Streamlit Cloud secrets
-                    api_key = None
-                    try:
-                        api_key = st.secrets.get("OPENAI_API_KEY")
-                    except:
-                        pass
-                    
-                    if api_key:
-                        response = _get_governance_answer(
-                            question=question,
-                            use_case=use_case,
-                            assessment=assessment,
-                            controls=controls,
-                            ai_analysis=ai_analysis,
-                            api_key=api_key
-                        )
-                        st.session_state.governance_chat.append({"role": "assistant", "content": response})
-                    else:
-                        st.session_state.governance_chat.append({
-                            "role": "assistant",
-                            "content": "⚠️ OpenAI API key not configured. Please contact the administrator."
-                        })
-                except Exception as e:
-                    st.session_state.governance_chat.append({
-                        "role": "assistant", 
-                        "content": f"❌ Error getting response: {str(e)}"
-                    })
-            
-            st.rerun()
-        
-        # Chat input
-        if question := st.chat_input("Ask about frameworks, safeguards, implementation steps, or request a draft..."):
-            # Add user message
-            st.session_state.governance_chat.append({"role": "user", "content": question})
-            
-            # Get AI response
-            with st.spinner("Thinking..."):
-                try:
-                    # Get API key from Streamlit Cloud secrets
-                    api_key = None
-                    try:
-                        api_key = st.secrets.get("OPENAI_API_KEY")
-                    except:
-                        pass
-                    
-                    if api_key:
-                        response = _get_governance_answer(
-                            question=question,
-                            use_case=use_case,
-                            assessment=assessment,
-                            controls=controls,
-                            ai_analysis=ai_analysis,
-                            api_key=api_key
-                        )
-                        st.session_state.governance_chat.append({"role": "assistant", "content": response})
-                    else:
-                        st.session_state.governance_chat.append({
-                            "role": "assistant",
-                            "content": "⚠️ OpenAI API key not configured. Please contact the administrator."
-                        })
-                except Exception as e:
-                    st.session_state.governance_chat.append({
-                        "role": "assistant", 
-                        "content": f"❌ Error getting response: {str(e)}"
-                    })
-            
-            st.rerun()
-        
-        # Export chat history
-        if st.session_state.governance_chat:
-            chat_export = "# Governance Q&A Session\n\n"
-            chat_export += f"**Scenario:** {use_case}\n\n"
-            chat_export += f"**Risk Tier:** {assessment.tier} (score: {assessment.score})\n\n"
-            chat_export += "---\n\n"
-            
-            for msg in st.session_state.governance_chat:
-                role = "**You:**" if msg["role"] == "user" else "**Governance Advisor:**"
-                chat_export += f"{role}\n{msg['content']}\n\n"
-            
+            if st.button("Cancel", use_container_width=True):
+                st.session_state.show_refinement_box = False
+                st.rerun()
+
+
+@st.fragment
+def _render_governance_chat(use_case: str, assessment, controls, ai_analysis) -> None:
+    """Render the governance Q&A; chat turns rerun only this fragment."""
+
+    st.markdown("---")
+    st.subheader("💬 Ask Questions About This Assessment")
+    st.caption("Get instant answers about safeguards, frameworks, implementation steps, or draft stakeholder communications")
+
+    # Initialize chat history
+    if "governance_chat" not in st.session_state:
+        st.session_state.governance_chat = []
+
+    # Suggested questions
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        if st.button("❓ Why this risk tier?", use_container_width=True):
+            _queue_questions(f"Why did this assessment result in {assessment.tier} tier? Explain the specific factors.")
+    with col2:
+        if st.button("📋 Explain safeguards", use_container_width=True):
+            _queue_questions("Explain the most critical safeguards and why they're required for this scenario.")
+    with col3:
+        if st.button("✉️ Draft email to legal", use_container_width=True):
+            _queue_questions("Draft a concise email to our legal team explaining why we need their review before launch.")
+    with col4:
+        if st.button("🛡️ Rationale per safeguard", use_container_width=True, disabled=not controls):
+            # One batched request covers every top safeguard instead of N round-trips
+            _queue_questions(*(
+                f"Why is '{control.title}' ({control.authority} {control.clause}) required here, and what is the first implementation step?"
+                for control in controls[:5]
+            ))
+
+    # Display chat history (older turns only on request)
+    history = st.session_state.governance_chat
+    hidden = len(history) - _CHAT_VISIBLE_MESSAGES
+    if hidden > 0 and not st.toggle(f"Show full history ({hidden} earlier messages)", key="_chat_full_history"):
+        history = history[hidden:]
+    for msg in history:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+
+    _collect_governance_batches()
+
+    # Drain questions queued by button clicks, several per request
+    pending = st.session_state.pop("pending_q_batch", [])
+    for start in range(0, len(pending), _CHAT_BATCH_MAX):
+        batch = pending[start:start + _CHAT_BATCH_MAX]
+        _handle_chat_turn(batch[0] if len(batch) == 1 else batch, use_case, assessment, controls, ai_analysis)
+
+    # Chat input
+    if question := st.chat_input("Ask about frameworks, safeguards, implementation steps, or request a draft..."):
+        _handle_chat_turn(question, use_case, assessment, controls, ai_analysis)
+
+    # Export chat history only once asked; the snapshot goes stale when the chat grows
+    chat = st.session_state.governance_chat
+    if chat:
+        if st.button("📝 Prepare Q&A Export", use_container_width=True, key="prepare_chat_export"):
+            st.session_state.chat_export_bytes = (
+                chat[-1],
+                _build_chat_export(use_case, assessment, chat).encode("utf-8"),
+            )
+
+        snapshot = st.session_state.get("chat_export_bytes")
+        if snapshot and snapshot[0] is chat[-1]:
             st.download_button(
                 label="📥 Export Q&A Session",
-                data=chat_export,
+                data=snapshot[1],
                 file_name="governance_qa_session.md",
                 mime="text/markdown",
                 use_container_width=True
             )
-    
-    # Gaps & Limitations with Re-Analysis Option (NEW)
-    if hasattr(ai_analysis, 'gaps_and_limitations') and ai_analysis.gaps_and_limitations:
-        st.markdown("---")
-        st.subheader("🔬 Assessment Gaps & Additional Context")
-        
-        st.info("**This is a demonstration assessment based on limited information.** The following areas couldn't be fully evaluated:")
-        
-        for i, gap in enumerate(ai_analysis.gaps_and_limitations, 1):
-            st.markdown(f"{i}. {gap}")
-        
-        st.markdown("**💡 Want a more comprehensive assessment?**")
-        st.caption("If you have additional details about the items above, provide them below to refine the analysis.")
-        
-        # Initialize session state for additional context
-        if "show_refinement_box" not in st.session_state:
-            st.session_state.show_refinement_box = False
-        
-        if not st.session_state.show_refinement_box:
-            if st.button("📝 Provide Additional Details", use_container_width=True):
-                st.session_state.show_refinement_box = True
-                st.rerun()
+
+
+def _build_chat_export(use_case: str, assessment, chat: Sequence[dict]) -> str:
+    """Render the Q&A history as a Markdown transcript."""
+
+    parts = [
+        "# Governance Q&A Session\n\n",
+        f"**Scenario:** {use_case}\n\n",
+        f"**Risk Tier:** {assessment.tier} (score: {assessment.score})\n\n",
+        "---\n\n",
+    ]
+    parts.extend("%s\n%s\n\n" % (_CHAT_ROLE_LABELS[msg["role"]], msg["content"]) for msg in chat)
+    return "".join(parts)
+
+
+def _handle_chat_turn(question: str | Sequence[str], use_case: str, assessment, controls, ai_analysis) -> None:
+    """Record one question (or numbered batch), then stream and record its answer."""
+
+    # Process the question (a list is shown as one numbered message)
+    st.session_state.governance_chat.append({
+        "role": "user",
+        "content": question if isinstance(question, str) else format_numbered_questions(question),
+    })
+
+    with st.chat_message("user"):
+        st.markdown(st.session_state.governance_chat[-1]["content"])
+
+    # Identical questions against the same assembled context and model reuse the
+    # earlier answer; a refined analysis or a model switch changes the key.
+    answer_cache = st.session_state.setdefault("governance_answer_cache", {})
+    questions = (question,) if isinstance(question, str) else tuple(question)
+    cache_key = (
+        questions,
+        _governance_system_prompt(use_case, assessment, controls, ai_analysis),
+        select_governance_model(questions, st.session_state.get("governance_draft_upgrade", False)),
+    )
+
+    # Non-urgent questions go to the Batch API; a placeholder note stands in for the answer
+    if st.session_state.get("governance_batch_mode") and cache_key not in answer_cache:
+        response = _queue_governance_answers(questions, use_case, assessment, controls, ai_analysis)
+        with st.chat_message("assistant"):
+            st.markdown(response)
+        st.session_state.governance_chat.append({"role": "assistant", "content": response})
+        return
+
+    # Stream the AI response into the chat as tokens arrive
+    with st.chat_message("assistant"):
+        try:
+            api_key = _api_key()
+
+            if cache_key in answer_cache:
+                response = answer_cache[cache_key]
+                st.markdown(response)
+            elif api_key:
+                response = st.write_stream(_get_governance_answer(
+                    question=question,
+                    use_case=use_case,
+                    assessment=assessment,
+                    controls=controls,
+                    ai_analysis=ai_analysis,
+                    api_key=api_key
+                ))
+                if not response.startswith("❌"):
+                    answer_cache[cache_key] = response
+                    while len(answer_cache) > _ANSWER_CACHE_MAX:
+                        answer_cache.pop(next(iter(answer_cache)))  # oldest first
+            else:
+                response = "⚠️ OpenAI API key not configured. Please contact the administrator."
+                st.markdown(response)
+        except Exception as e:
+            response = f"❌ Error getting response: {str(e)}"
+            st.markdown(response)
+    st.session_state.governance_chat.append({"role": "assistant", "content": response})
+
+
+def _queue_governance_answers(questions: Sequence[str], use_case: str, assessment, controls, ai_analysis) -> str:
+    """Submit each question as its own Batch API request and return the chat note."""
+    from common.utils.openai_helpers import submit_chat_batch
+
+    system_prompt = _governance_system_prompt(use_case, assessment, controls, ai_analysis)
+    queued = submit_chat_batch(
+        [
+            (f"q{i}", [{"role": "system", "content": system_prompt}, {"role": "user", "content": question}])
+            for i, question in enumerate(questions, 1)
+        ],
+        model=select_governance_model(questions, st.session_state.get("governance_draft_upgrade", False)),
+        temperature=0.7,
+        # Each question is its own request, so each gets its own cap
+        max_tokens={f"q{i}": estimate_answer_tokens(question) for i, question in enumerate(questions, 1)},
+        api_key=_api_key(),
+    )
+    if not queued["success"]:
+        return f"❌ Could not queue for batch processing: {queued['error']}"
+
+    st.session_state.setdefault("governance_batches", {})[queued["batch_id"]] = tuple(questions)
+    return (
+        f"🕒 Queued {len(questions)} question(s) for batch processing (batch `{queued['batch_id']}`). "
+        "Answers will be added here when ready."
+    )
+
+
+@st.fragment(run_every="30s")
+def _collect_governance_batches() -> None:
+    """Poll queued Q&A batches and move finished answers into the chat."""
+    from common.utils.openai_helpers import retrieve_chat_batch
+
+    batches = st.session_state.get("governance_batches")
+    if not batches:
+        return
+
+    collected = False
+    for batch_id, questions in list(batches.items()):
+        status = retrieve_chat_batch(batch_id, api_key=_api_key())
+        if not status["success"]:
+            st.caption(f"⚠️ {status['error']}")
+            continue
+        if status["status"] in ("failed", "expired", "cancelled"):
+            answers = {}
+        elif status["status"] != "completed":
+            st.caption(f"⏳ Q&A batch `{batch_id}`: {status['status']} (checks every 30s)")
+            continue
         else:
-            additional_context = st.text_area(
-                "Additional Details:",
-                placeholder="Example: 'Data is stored in AWS us-east-1. We have a BAA with AWS. Human clinicians review all medication suggestions before approval...'",
-                height=120,
-                key="additional_context_input"
-            )
-            
-            col1, col2 = st.columns([1, 1])
-            with col1:
-                if st.button("🔄 Re-Analyze with Additional Context", use_container_width=True, type="primary"):
-                    if additional_context and additional_context.strip():
-                        # Store original analysis for comparison
-                        original_gaps = ai_analysis.gaps_and_limitations.copy()
-                        original_tier = ai_analysis.estimated_risk_tier
-                        
-                        # Build enriched prompt with gap context
-                        gaps_context = "\n\n**Previous Assessment Gaps:**\n" + "\n".join([f"- {gap}" for gap in ai_analysis.gaps_and_limitations])
-                        enriched_description = (
-                            use_case + 
-                            gaps_context + 
-                            "\n\n**Additional Context to Address Gaps:**\n" + additional_context
-                        )
-                        
-                        # Re-run analysis with enriched context (bypass interview, go straight to analysis)
-                        with st.spinner("Re-analyzing with additional context..."):
-                            try:
-                                api_key = None
-                                try:
-                                    api_key = st.secrets.get("OPENAI_API_KEY")
-                                except:
-                                    pass
-                                
-                                if api_key:
-                                    refined_analysis = parse_scenario_with_ai(enriched_description, api_key=api_key, demo_mode=demo_mode)
-                                    if refined_analysis:
-                                        # Compare and store what changed
-                                        resolved_gaps = [gap for gap in original_gaps if gap not in refined_analysis.gaps_and_limitations]
-                                        tier_changed = original_tier != refined_analysis.estimated_risk_tier
-                                        
-                                        comparison = {
-                                            "resolved_gaps": resolved_gaps,
-                                            "original_tier": original_tier,
-                                            "new_tier": refined_analysis.estimated_risk_tier,
-                                            "tier_changed": tier_changed,
-                                            "additional_context": additional_context
-                                        }
-                                        
-                                        # Update session state and re-render
-                                        st.session_state.ai_analysis = refined_analysis
-                                        st.session_state.refinement_comparison = comparison
-                                        st.session_state.show_refinement_box = False
-                                        st.rerun()
-                                else:
-                                    st.error("⚠️ OpenAI API key not configured.")
-                            except Exception as e:
-                                st.error(f"❌ Re-analysis failed: {str(e)}")
-                    else:
-                        st.warning("⚠️ Please provide additional details to re-analyze.")
-            with col2:
-                if st.button("Cancel", use_container_width=True):
-                    st.session_state.show_refinement_box = False
-                    st.rerun()
+            answers = status["data"]
 
-    st.markdown("---")
-    _render_about_section()
+        del batches[batch_id]
+        collected = True
+        for i, question in enumerate(questions, 1):
+            answer = answers.get(f"q{i}", f"❌ Batch {status['status']} without an answer.")
+            st.session_state.governance_chat.append({
+                "role": "assistant",
+                "content": f"**Batched answer:** *{question}*\n\n{answer}",
+            })
+
+    if collected:
+        # Output drawn here would vanish on the next empty tick, so let the chat
+        # history loop render the new answers instead.
+        st.rerun()
+
+
+def _queue_questions(*questions: str) -> None:
+    """Queue suggested questions for the next batched request, skipping duplicates."""
+
+    pending = st.session_state.setdefault("pending_q_batch", [])
+    pending.extend(q for q in dict.fromkeys(questions) if q not in pending)
 
 
 def _render_about_section():
@@ -0,0 +1,203 @@
+"""Tests for the AI interviewer prompt helpers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from common.utils import ai_interviewer
+from common.utils.ai_interviewer import (
+    InterviewQuestion,
+    InterviewResponse,
+    InterviewTurnResult,
+    conduct_follow_up_interview,
+    conduct_follow_up_interview_cached,
+    conduct_interview,
+    format_indexed_history,
+    stream_interview,
+)
+
+
+def test_format_indexed_history_tags_each_turn():
+    """Test that every Q&A turn is tagged with its position identifier."""
+    history = [
+        {"question": "Where is data stored?", "answer": "US only"},
+        {"question": "Is there human review?", "answer": "Yes, nurses approve"},
+    ]
+
+    formatted = format_indexed_history(history)
+
+    assert formatted.startswith("[1] Q: Where is data stored?\nA: US only")
+    assert "[2] Q: Is there human review?\nA: Yes, nurses approve" in formatted
+    assert formatted.index("[1]") < formatted.index("[2]")
+
+
+def test_format_indexed_history_empty():
+    """Test that an empty history yields an empty block."""
+    assert format_indexed_history([]) == ""
+
+
+def test_interview_question_answer_index_optional():
+    """Test that follow-up questions may omit the answer index."""
+    question = InterviewQuestion(
+        question="Who reviews outputs?",
+        rationale="Human oversight",
+        framework_reference="EU AI Act Art. 14",
+    )
+
+    assert question.answer_index is None
+
+
+def test_conduct_interview_demo_mode():
+    """Test that demo mode returns canned questions without an API call."""
+    response = conduct_interview(
+        "A chatbot for hospital scheduling",
+        conversation_history=[{"question": "Q", "answer": "A"}],
+        demo_mode=True,
+    )
+
+    assert response is not None
+    assert response.questions
+
+
+def test_conduct_follow_up_interview_demo_mode_returns_analysis():
+    """Test that an answered round yields the readiness decision and analysis together."""
+    interview, analysis = conduct_follow_up_interview(
+        "A chatbot for hospital scheduling",
+        [{"question": "Where is data stored?", "answer": "US only"}],
+        demo_mode=True,
+    )
+
+    assert interview.ready_for_analysis is True
+    assert analysis is not None
+    assert analysis.estimated_risk_tier
+
+
+def test_conduct_follow_up_interview_drops_analysis_when_not_ready(monkeypatch):
+    """Test that an analysis is ignored when the interviewer still wants answers."""
+    from common.utils import openai_helpers
+
+    demo_analysis = openai_helpers._get_demo_response(
+        ai_interviewer.ScenarioAnalysis
+    )["data"]
+
+    def fake_call(messages, **kwargs):
+        assert kwargs["response_format"] is InterviewTurnResult
+        return {
+            "success": True,
+            "data": InterviewTurnResult(
+                interview=InterviewResponse(needs_clarification=True, ready_for_analysis=False),
+                analysis=demo_analysis,
+            ),
+        }
+
+    monkeypatch.setattr(openai_helpers, "safe_openai_call", fake_call)
+
+    interview, analysis = conduct_follow_up_interview(
+        "Scheduling bot", [{"question": "Q", "answer": "A"}], api_key="sk-test"
+    )
+
+    assert interview.ready_for_analysis is False
+    assert analysis is None
+
+
+def test_conduct_follow_up_interview_cached_skips_resubmitted_answers(monkeypatch):
+    """Test that resubmitting whitespace-only edits reuses the previous analysis."""
+    calls = []
+
+    def fake_follow_up(description, history, api_key, demo_mode):
+        calls.append(history)
+        return InterviewResponse(needs_clarification=False, ready_for_analysis=True), None
+
+    monkeypatch.setattr(ai_interviewer, "conduct_follow_up_interview", fake_follow_up)
+    ai_interviewer._conduct_follow_up_memo.cache_clear()
+
+    first = conduct_follow_up_interview_cached(
+        "Scheduling bot", [{"question": "Q", "answer": "A"}], api_key="sk-test"
+    )
+    second = conduct_follow_up_interview_cached(
+        " Scheduling bot ", [{"question": "Q", "answer": "A \n"}], api_key="sk-test"
+    )
+
+    assert first is second
+    assert calls == [[{"question": "Q", "answer": "A"}]]
+    ai_interviewer._conduct_follow_up_memo.cache_clear()
+
+
+def test_stream_interview_hands_over_questions_as_they_complete(monkeypatch):
+    """Test that each question is emitted once the next one starts streaming."""
+    from common.utils import openai_helpers
+
+    first = {"question": "Where is data stored?", "rationale": "GDPR", "framework_reference": "GDPR Art. 44", "answer_index": None}
+    second = {"question": "Who reviews outputs?", "rationale": "Oversight", "framework_reference": "EU AI Act Art. 14", "answer_index": None}
+    final = InterviewResponse(
+        needs_clarification=True,
+        questions=[InterviewQuestion(**first), InterviewQuestion(**second)],
+    )
+    seen = []
+    partials = [
+        {"questions": [{"question": "Where is"}]},
+        {"questions": [first, {"question": "Who"}]},
+        {"questions": [first, second]},
+    ]
+
+    class FakeStream:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def __iter__(self):
+            for parsed in partials:
+                seen.append(("event", len(parsed["questions"])))
+                yield SimpleNamespace(type="content.delta", parsed=parsed)
+
+        def get_final_completion(self):
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(parsed=final))])
+
+    client = SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(stream=lambda **kw: FakeStream())))
+    )
+    monkeypatch.setattr(openai_helpers, "get_openai_client", lambda api_key: client)
+    ai_interviewer._FIRST_ROUND_CACHE.clear()
+
+    response = stream_interview(
+        "Scheduling bot", lambda q: seen.append(("question", q.question)), api_key="sk-test"
+    )
+
+    assert response is final
+    assert seen == [
+        ("event", 1),
+        ("event", 2),
+        ("question", "Where is data stored?"),
+        ("event", 2),
+        ("question", "Who reviews outputs?"),
+    ]
+    ai_interviewer._FIRST_ROUND_CACHE.clear()
+
+
+def test_stream_interview_replays_cached_first_round(monkeypatch):
+    """Test that re-analyzing the same description replays questions without a call."""
+    calls = []
+
+    def fake_stream(description, api_key, demo_mode, on_question):
+        calls.append(description)
+        response = InterviewResponse(
+            needs_clarification=True,
+            questions=[InterviewQuestion(question="Where is data stored?", rationale="GDPR", framework_reference="GDPR")],
+        )
+        for question in response.questions:
+            on_question(question)
+        return response
+
+    monkeypatch.setattr(ai_interviewer, "_stream_first_round", fake_stream)
+    ai_interviewer._FIRST_ROUND_CACHE.clear()
+
+    seen = []
+    first = stream_interview("Scheduling bot", seen.append, api_key="sk-test")
+    second = stream_interview("  Scheduling bot\n", seen.append, api_key="sk-test")
+
+    assert first is second
+    assert calls == ["Scheduling bot"]
+    assert [q.question for q in seen] == ["Where is data stored?", "Where is data stored?"]
+    ai_interviewer._FIRST_ROUND_CACHE.clear()
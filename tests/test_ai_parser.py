@@ -180,3 +180,39 @@ def test_parse_scenario_missing_api_key(monkeypatch):
     result = parse_scenario_with_ai("Test scenario", api_key=None, demo_mode=False)
     assert result is None
 
+
+
+def test_parse_scenario_cached_reuses_identical_descriptions(monkeypatch):
+    """Test that resubmitting the same description does not call the parser again."""
+    from common.utils import ai_parser
+
+    calls = []
+
+    def fake_parse(description, api_key, model, demo_mode):
+        calls.append(description)
+        return None if description == "fails" else ScenarioAnalysis(
+            contains_pii=False,
+            customer_facing=False,
+            high_stakes=False,
+            autonomy_level=0,
+            sector="General",
+            modifiers=[],
+            reasoning="Internal tool.",
+            estimated_risk_tier="Low",
+            key_risk_factors=[],
+            recommended_safeguards=[],
+            framework_alignment="NIST AI RMF",
+        )
+
+    monkeypatch.setattr(ai_parser, "parse_scenario_with_ai", fake_parse)
+    ai_parser._parse_scenario_memo.cache_clear()
+
+    first = ai_parser.parse_scenario_with_ai_cached("Internal code copilot", api_key="sk-test")
+    second = ai_parser.parse_scenario_with_ai_cached("  Internal code copilot \n", api_key="sk-test")
+    assert first is second
+    assert calls == ["Internal code copilot"]
+
+    # Failures are retried rather than cached
+    assert ai_parser.parse_scenario_with_ai_cached("fails", api_key="sk-test") is None
+    assert ai_parser.parse_scenario_with_ai_cached("fails", api_key="sk-test") is None
+    assert calls.count("fails") == 2
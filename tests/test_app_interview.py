@@ -0,0 +1,52 @@
+"""Tests for the interview flow in the Streamlit app."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from common.utils import ai_interviewer
+from common.utils.ai_interviewer import InterviewQuestion, InterviewResponse
+from common.utils.ai_parser import ScenarioAnalysis
+
+APP = Path(__file__).resolve().parents[1] / "project1_risk_framework" / "app.py"
+
+
+def test_resubmitting_answers_after_an_error_sends_the_same_history(monkeypatch):
+    """Test that a failed round is not recorded, so a resubmit repeats the same history."""
+    questions = InterviewResponse(
+        needs_clarification=True,
+        questions=[
+            InterviewQuestion(
+                question="Where is data stored?",
+                rationale="Residency rules",
+                framework_reference="GDPR",
+            )
+        ],
+    )
+    histories = []
+
+    def fake_follow_up(description, history, api_key=None, demo_mode=False):
+        histories.append(list(history))
+        if len(histories) == 1:
+            raise Exception("Interview failed: timeout")
+        return InterviewResponse(needs_clarification=False, ready_for_analysis=True), ScenarioAnalysis()
+
+    monkeypatch.setattr(ai_interviewer, "stream_interview", lambda *args, **kwargs: questions)
+    monkeypatch.setattr(ai_interviewer, "conduct_follow_up_interview_cached", fake_follow_up)
+
+    at = AppTest.from_file(str(APP), default_timeout=60)
+    at.secrets["OPENAI_API_KEY"] = "sk-test"
+    at.run()
+    at.text_area[0].input("Chatbot that triages patient messages")
+    next(b for b in at.button if "Analyze" in b.label).click().run()
+    at.text_area(key="interview_q_0").input("US only")
+
+    at.button[-1].click().run()
+    assert any("timeout" in error.value for error in at.error)
+    assert len(at.session_state["interview_history"]) == 0
+
+    at.button[-1].click().run()
+    assert not at.exception
+    assert histories == [[{"question": "Where is data stored?", "answer": "US only"}]] * 2
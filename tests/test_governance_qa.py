@@ -0,0 +1,143 @@
+"""Tests for governance Q&A prompt assembly."""
+
+from __future__ import annotations
+
+import json
+
+from common.utils.governance_qa import (
+    ANSWER_TOKEN_BUDGETS,
+    DEFAULT_GOVERNANCE_MODEL,
+    DRAFTING_MODEL,
+    GOVERNANCE_ANSWER_FORMAT,
+    GOVERNANCE_MODEL_ENV,
+    GOVERNANCE_SYSTEM_PREAMBLE,
+    MAX_BATCHED_ANSWER_TOKENS,
+    build_governance_context,
+    classify_question,
+    estimate_answer_tokens,
+    format_answer_extras,
+    format_numbered_questions,
+    select_governance_model,
+    stream_structured_answer,
+)
+
+
+def _context(**overrides):
+    params = dict(
+        use_case="Hospital scheduling chatbot",
+        tier="High",
+        score=8,
+        contributing_factors=("Contains PII (+2)",),
+        top_controls=(("Human oversight", "EU AI Act", "Art. 14", "Review outputs"),),
+        frameworks_text="EU AI Act",
+        reasoning="Processes PHI",
+    )
+    params.update(overrides)
+    return build_governance_context(**params)
+
+
+def test_preamble_is_static():
+    """Test that the shared preamble carries no assessment-specific values."""
+    assert "{" not in GOVERNANCE_SYSTEM_PREAMBLE
+    assert "CURRENT ASSESSMENT CONTEXT" not in GOVERNANCE_SYSTEM_PREAMBLE
+
+
+def test_build_governance_context_includes_assessment():
+    """Test that the dynamic block carries tier, score, and safeguards."""
+    context = _context()
+
+    assert "Hospital scheduling chatbot" in context
+    assert "Tier: High" in context
+    assert "1. **Human oversight** (EU AI Act Art. 14): Review outputs" in context
+    assert "specific to this High tier scenario with score 8" in context
+
+
+def test_build_governance_context_is_memoized():
+    """Test that identical assessments reuse the cached context string."""
+    assert _context() is _context()
+
+
+def test_build_governance_context_without_controls():
+    """Test the fallback text when no safeguards were triggered."""
+    context = _context(top_controls=(), contributing_factors=())
+
+    assert "No specific safeguards triggered" in context
+    assert "Key Risk Factors: None" in context
+
+
+def test_format_numbered_questions():
+    """Test that batched questions are numbered in order."""
+    assert format_numbered_questions(["Why?", "How?"]) == "1. Why?\n2. How?"
+
+
+def test_estimate_answer_tokens_by_question_kind():
+    """Test that drafting requests get the largest completion cap."""
+    assert classify_question("Draft an email to legal about this") == "draft"
+    assert classify_question("How do I implement human oversight?") == "explain"
+    assert classify_question("What is GDPR Art. 22?") == "fact"
+    assert estimate_answer_tokens("What is GDPR Art. 22?") == ANSWER_TOKEN_BUDGETS["fact"]
+    assert estimate_answer_tokens("Write a memo for the CISO") == ANSWER_TOKEN_BUDGETS["draft"]
+
+
+def test_estimate_answer_tokens_caps_batches():
+    """Test that batched questions get the sum of their budgets up to a ceiling."""
+    assert estimate_answer_tokens(["What is PII?"]) == ANSWER_TOKEN_BUDGETS["fact"]
+    assert estimate_answer_tokens(["Why?"] * 5) == 5 * ANSWER_TOKEN_BUDGETS["explain"]
+    assert estimate_answer_tokens(["Draft it"] * 6) == MAX_BATCHED_ANSWER_TOKENS
+
+
+def test_select_governance_model_upgrades_only_opted_in_drafting(monkeypatch):
+    """Test that gpt-4o is reserved for drafting requests when the toggle is on."""
+    monkeypatch.delenv(GOVERNANCE_MODEL_ENV, raising=False)
+    assert select_governance_model("Draft an email to legal") == DEFAULT_GOVERNANCE_MODEL
+    assert select_governance_model("Draft an email to legal", upgrade_drafting=True) == DRAFTING_MODEL
+    assert select_governance_model(["What is PII?"], upgrade_drafting=True) == DEFAULT_GOVERNANCE_MODEL
+
+    monkeypatch.setenv(GOVERNANCE_MODEL_ENV, "gpt-4.1-mini")
+    assert select_governance_model("What is PII?") == "gpt-4.1-mini"
+
+
+def test_answer_format_requires_all_fields():
+    """Test that the structured answer schema is strict and answer-first."""
+    schema = GOVERNANCE_ANSWER_FORMAT["json_schema"]["schema"]
+
+    assert GOVERNANCE_ANSWER_FORMAT["json_schema"]["strict"] is True
+    assert list(schema["properties"]) == ["answer", "citations", "caveats"]
+    assert schema["required"] == ["answer", "citations", "caveats"]
+
+
+def test_stream_structured_answer_yields_answer_then_extras():
+    """Test that the answer streams across chunk boundaries before the extras."""
+    payload = {
+        "answer": 'Escalate to "legal" first.\nThen add review 😀',
+        "citations": ["GDPR Art. 22"],
+        "caveats": "Validate with counsel.",
+    }
+    text = json.dumps(payload)
+    chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+
+    pieces = list(stream_structured_answer(chunks))
+
+    assert "".join(pieces[:-1]) == payload["answer"]
+    assert pieces[-1] == format_answer_extras(payload)
+    assert "- GDPR Art. 22" in pieces[-1]
+    assert "*Caveats: Validate with counsel.*" in pieces[-1]
+
+
+def test_stream_structured_answer_holds_back_partial_escapes():
+    """Test that escape sequences split across chunks are never emitted half-decoded."""
+    pieces = list(stream_structured_answer(['{"answer": "caf\\u00', 'e9 ok", "citations": [], "caveats": ""}']))
+
+    assert pieces == ["caf", "é ok"]
+
+
+def test_stream_structured_answer_keeps_truncated_answer():
+    """Test that a stream cut off by max_tokens still returns the partial answer."""
+    pieces = list(stream_structured_answer(['{"answer": "Partial ans', 'wer']))
+
+    assert "".join(pieces) == "Partial answer"
+
+
+def test_stream_structured_answer_passes_through_plain_text():
+    """Test that non-JSON output is shown rather than dropped."""
+    assert "".join(stream_structured_answer(["Plain ", "text"])) == "Plain text"
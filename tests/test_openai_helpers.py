@@ -0,0 +1,84 @@
+"""Tests for centralized OpenAI helper utilities."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from common.utils.openai_helpers import (
+    build_batch_jsonl,
+    get_openai_client,
+    parse_batch_output,
+    submit_chat_batch,
+)
+
+
+def test_build_batch_jsonl_one_line_per_request():
+    """Test that each request becomes a chat-completions batch line."""
+    requests = [
+        ("ctl-1", [{"role": "user", "content": "Why?"}]),
+        ("ctl-2", [{"role": "user", "content": "How?"}]),
+    ]
+
+    payload = build_batch_jsonl(requests, model="gpt-4o", temperature=0.5, max_tokens=300)
+    lines = [json.loads(line) for line in payload.splitlines()]
+
+    assert [line["custom_id"] for line in lines] == ["ctl-1", "ctl-2"]
+    assert all(line["url"] == "/v1/chat/completions" for line in lines)
+    assert lines[0]["body"]["max_tokens"] == 300
+    assert lines[1]["body"]["messages"][0]["content"] == "How?"
+
+
+def test_build_batch_jsonl_omits_unset_max_tokens():
+    """Test that max_tokens is only sent when provided."""
+    payload = build_batch_jsonl([("a", [{"role": "user", "content": "Hi"}])])
+
+    assert "max_tokens" not in json.loads(payload)["body"]
+
+
+def test_parse_batch_output_maps_custom_ids():
+    """Test that batch results are keyed by custom_id, including failures."""
+    output = "\n".join([
+        json.dumps({
+            "custom_id": "ctl-1",
+            "response": {"body": {"choices": [{"message": {"content": "Because GDPR."}}]}},
+        }),
+        json.dumps({"custom_id": "ctl-2", "response": None, "error": {"message": "rate limited"}}),
+        "",
+    ])
+
+    results = parse_batch_output(output)
+
+    assert results["ctl-1"] == "Because GDPR."
+    assert "rate limited" in results["ctl-2"]
+
+
+def test_build_batch_jsonl_per_request_max_tokens():
+    """Test that a mapping sets each request's completion cap by custom_id."""
+    requests = [
+        ("a", [{"role": "user", "content": "Draft a memo"}]),
+        ("b", [{"role": "user", "content": "What is PII?"}]),
+    ]
+    payload = build_batch_jsonl(requests, max_tokens={"a": 800, "b": 250})
+
+    bodies = [json.loads(line)["body"] for line in payload.splitlines()]
+    assert [body["max_tokens"] for body in bodies] == [800, 250]
+
+
+def test_submit_chat_batch_requires_api_key():
+    """Test that batch submission fails cleanly without credentials."""
+    result = submit_chat_batch([("a", [{"role": "user", "content": "Hi"}])])
+
+    assert result["success"] is False
+    assert "API key" in result["error"]
+
+
+def test_get_openai_client_shared_per_key():
+    """Test that one client (and its connection pool) is reused per API key."""
+    pytest.importorskip("openai")
+
+    first = get_openai_client("sk-test-a")
+
+    assert get_openai_client("sk-test-a") is first
+    assert get_openai_client("sk-test-b") is not first
@@ -8,9 +8,12 @@ from common.utils.policy_loader import (
     PolicyControl,
     ScenarioContext,
     WhenClause,
+    build_scenario_context,
     control_matches,
     load_policy_pack,
     load_policy_packs,
+    load_policy_packs_cached,
+    policy_packs_fingerprint,
     select_applicable_controls,
 )
 
@@ -259,6 +262,75 @@ def test_load_policy_packs_empty_directory(tmp_path):
         load_policy_packs(empty_dir)
 
 
+def test_load_policy_packs_cached_writes_and_reuses_pickle(tmp_path):
+    """Test that the warm cache matches a fresh load and is reused."""
+    packs_dir = Path("common/policy_packs")
+    cache_dir = tmp_path / "cache"
+
+    packs = load_policy_packs_cached(packs_dir, cache_dir=cache_dir)
+    cached_files = list(cache_dir.glob("packs-*.pkl"))
+
+    assert len(cached_files) == 1
+    assert packs == load_policy_packs(packs_dir)
+    assert load_policy_packs_cached(packs_dir, cache_dir=cache_dir) == packs
+
+
+def test_load_policy_packs_cached_replaces_stale_pickles(tmp_path):
+    """Test that writing a new pickle removes ones for older fingerprints."""
+    packs_dir = Path("common/policy_packs")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "packs-0000000000000000.pkl").write_bytes(b"stale")
+
+    load_policy_packs_cached(packs_dir, cache_dir=cache_dir)
+
+    assert [path.name for path in cache_dir.iterdir()] == [
+        f"packs-{policy_packs_fingerprint(packs_dir)}.pkl"
+    ]
+
+
+def test_load_policy_packs_cached_survives_pickling_errors(tmp_path, monkeypatch):
+    """Test that a failed cache write still returns packs and leaves no temp file."""
+    import pickle
+
+    from common.utils import policy_loader
+
+    def failing_dump(*args, **kwargs):
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(policy_loader.pickle, "dump", failing_dump)
+    cache_dir = tmp_path / "cache"
+
+    packs = load_policy_packs_cached(Path("common/policy_packs"), cache_dir=cache_dir)
+
+    assert packs
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize("payload", [b"\x80\x05\x95garbage", b"\x80\x04K\x01.", b"\x80\x04]\x94K\x01a."])
+def test_load_policy_packs_cached_ignores_bad_pickles(tmp_path, payload):
+    """Test that corrupt pickles or ones holding anything but packs trigger a fresh load."""
+    packs_dir = Path("common/policy_packs")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / f"packs-{policy_packs_fingerprint(packs_dir)}.pkl").write_bytes(payload)
+
+    packs = load_policy_packs_cached(packs_dir, cache_dir=cache_dir)
+
+    assert packs == load_policy_packs(packs_dir)
+
+
+def test_policy_packs_fingerprint_changes_on_edit(tmp_path):
+    """Test that editing a pack produces a new cache key."""
+    pack_path = tmp_path / "pack.yaml"
+    pack_path.write_text(Path("common/policy_packs/nist_ai_rmf.yaml").read_text())
+    before = policy_packs_fingerprint(tmp_path)
+
+    pack_path.write_text(pack_path.read_text() + "\n# edited\n")
+
+    assert policy_packs_fingerprint(tmp_path) != before
+
+
 def test_select_applicable_controls():
     """Test selecting controls across multiple packs."""
     packs = load_policy_packs(Path("common/policy_packs"))
@@ -338,5 +410,65 @@ def test_scenario_context_defaults():
     assert scenario.high_stakes is False
     assert scenario.autonomy_level == 0
     assert scenario.sector == "General"
-    assert scenario.modifiers == []
+    assert scenario.modifiers == ()
+
+
+
+def test_scenario_context_hashable():
+    """Test ScenarioContext is frozen so it can key cached selections."""
+    scenario = ScenarioContext(tier="High", modifiers=["Cyber"])
+
+    assert scenario.modifiers == ("Cyber",)
+    assert hash(scenario) == hash(ScenarioContext(tier="High", modifiers=("Cyber",)))
+    with pytest.raises(Exception):  # Pydantic ValidationError
+        scenario.tier = "Low"
+
+
+def test_build_scenario_context_copies_inputs_and_caches():
+    """Test that risk inputs map onto the scenario and repeat calls are cached."""
+    from common.utils.risk_engine import RiskInputs
+
+    inputs = RiskInputs(contains_pii=True, sector="Healthcare", modifiers=["Cyber"])
+    scenario = build_scenario_context(inputs, "High")
+
+    assert scenario.tier == "High"
+    assert scenario.contains_pii is True
+    assert scenario.sector == "Healthcare"
+    assert scenario.modifiers == ("Cyber",)
+    assert build_scenario_context(RiskInputs(contains_pii=True, sector="Healthcare", modifiers=["Cyber"]), "High") is scenario
+
+
+def test_control_display_strings_are_cached():
+    """Test that tag and mapping display strings are built once per control."""
+    control = PolicyControl(
+        id="ctl-1",
+        title="Human oversight",
+        description="Review outputs",
+        authority="EU AI Act",
+        clause="Art. 14",
+        evidence="Review log",
+        tags=["oversight", "hitl"],
+        mappings={"NIST AI RMF": ["GOVERN 1.1", "MAP 2.3"]},
+        when=WhenClause(),
+    )
+
+    assert control.tags_text == "oversight, hitl"
+    assert control.mappings_text == "NIST AI RMF: GOVERN 1.1, MAP 2.3"
+    assert control.tags_text is control.tags_text
+
+
+def test_control_display_strings_without_tags_or_mappings():
+    """Test the fallbacks for controls with no tags or mappings."""
+    control = PolicyControl(
+        id="ctl-2",
+        title="Logging",
+        description="Keep logs",
+        authority="NIST AI RMF",
+        clause="MEASURE 2.1",
+        evidence="Log retention policy",
+        tags=None,
+        when=WhenClause(),
+    )
 
+    assert control.tags_text == "None"
+    assert control.mappings_text == ""
@@ -265,7 +265,19 @@ def test_risk_inputs_defaults():
     assert inputs.high_stakes is False
     assert inputs.autonomy_level == 0
     assert inputs.sector == "General"
-    assert inputs.modifiers == []
+    assert inputs.modifiers == ()
+
+
+def test_risk_inputs_frozen_and_hashable():
+    """Test RiskInputs can be used as a cache key and is immutable."""
+    first = RiskInputs(modifiers=["Bio", "Cyber"], protected_populations=["Elderly"])
+    second = RiskInputs(modifiers=("Bio", "Cyber"), protected_populations=("Elderly",))
+
+    assert first.modifiers == ("Bio", "Cyber")
+    assert hash(first) == hash(second)
+    assert first == second
+    with pytest.raises(Exception):  # Pydantic ValidationError
+        first.contains_pii = True
 
 
 def test_risk_inputs_forbids_extra_fields():